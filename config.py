@@ -23,6 +23,7 @@ RUNS_DIR = Path(os.environ.get("HEARINGS_RUNS_DIR", str(ROOT / "runs")))
 TRANSCRIPTS_DIR = Path(os.environ.get("HEARINGS_TRANSCRIPTS_DIR", str(ROOT / "transcripts")))
 DATA_DIR = ROOT / "data"
 COMMITTEES_JSON = DATA_DIR / "committees.json"
+CSPAN_COOKIES_JSON = DATA_DIR / "cspan_cookies.json"  # cached CloudFront WAF cookies
 
 # ---------------------------------------------------------------------------
 # Queue / outbox feature flags (north-star rollout)
@@ -148,6 +149,10 @@ DIGEST_POLISH_MODEL = os.environ.get("DIGEST_POLISH_MODEL", "anthropic/claude-ha
 DIGEST_RECIPIENT = os.environ.get("DIGEST_RECIPIENT", "archiehk98@gmail.com")
 DIGEST_SCORE_THRESHOLD = float(os.environ.get("DIGEST_SCORE_THRESHOLD", "0.40"))
 DIGEST_LOOKBACK_DAYS = int(os.environ.get("DIGEST_LOOKBACK_DAYS", "4"))
+# Cached digest LLM responses older than this are ignored and pruned: long
+# enough for dry runs and retries of one digest, short enough that a bad
+# response is never replayed into the next scheduled digest
+DIGEST_LLM_CACHE_TTL_HOURS = float(os.environ.get("DIGEST_LLM_CACHE_TTL_HOURS", "24"))
 
 # AgentMail sender address for digest delivery
 AGENTMAIL_SENDER = os.environ.get("AGENTMAIL_SENDER", "archie-agent@agentmail.to")
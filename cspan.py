@@ -7,17 +7,29 @@ transcript JSON API.
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
+import io
+import itertools
 import json
 import logging
 import os
+import queue
 import re
+import sys
 import tempfile
+import threading
 import time as _time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from urllib.parse import quote_plus
+from typing import TextIO
+from urllib.parse import parse_qs, quote_plus, urlparse
 
 import httpx
+from bs4 import BeautifulSoup, SoupStrainer
 
 import config
 from utils import TITLE_STOPWORDS, RateLimiter
@@ -62,13 +74,21 @@ def _batch_cooldown(searches_done: int, label: str) -> None:
 
 
 # Pre-compiled regex patterns for transcript processing
-_NEWLINE_RE = re.compile(r"\n+")
-_MULTI_SPACE_RE = re.compile(r"\s{2,}")
 _SENTENCE_SPLIT_RE = re.compile(r"([.!?]\s+)")
 _SENTENCE_BOUNDARY_RE = re.compile(r"^[.!?]\s+$")
+# bytes.translate delete table: every byte except A-Z
+_NON_UPPER_BYTES = bytes(b for b in range(256) if not 65 <= b <= 90)
 
 # Pre-compiled regex for C-SPAN program/event ID extraction from URLs
 _CSPAN_PROGRAM_ID_RE = re.compile(r"/(?:program|event)/[^/]+/[^/]+/(\d+)")
+# Trailing numeric ID of a program URL (fetch_cspan_transcript)
+_TRAILING_ID_RE = re.compile(r"/(\d+)/?$")
+# C-SPAN program/event URL (DDG result links)
+_CSPAN_URL_RE = re.compile(r"https?://www\.c-span\.org/(?:program|event)/[^\s\"'<>&]+")
+# Characters dropped from a lowercased title before keyword extraction.
+# Kept as a regex: a str.translate table that also strips non-ASCII
+# (curly quotes, dashes) needs a __missing__ hook and measured ~2.8x slower.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
 
 # Known abbreviations to preserve when converting ALL CAPS to sentence case
 _PRESERVE_ABBREVS = frozenset({
@@ -78,43 +98,319 @@ _PRESERVE_ABBREVS = frozenset({
     "HHS", "HUD", "DHS", "FEMA", "SBA", "NIH", "CDC", "FDA",
     "CFPB", "FHFA", "FSOC", "OCC", "CFTC", "NCUA",
 })
+# Trailing punctuation stripped before the abbreviation lookup
+_WORD_STRIP_CHARS = ".,;:!?'\""
 
 
-def _launch_cspan_browser(p):
-    """Launch a Playwright browser configured for C-SPAN."""
-    browser = p.chromium.launch(headless=True)
-    context = browser.new_context(user_agent=_UA)
-    page = context.new_page()
-    return browser, context, page
+# Resource types aborted before they are requested.  Search pages are only
+# read for text and /program/ anchors, so styling is dead weight there; the
+# transcript page keeps stylesheets/scripts since the WAF challenge needs them.
+_DISCOVERY_BLOCKED_RESOURCES = frozenset({"image", "media", "font", "stylesheet"})
+_TRANSCRIPT_BLOCKED_RESOURCES = frozenset({"image", "media"})
 
 
-def _navigate_with_waf_recovery(p, browser, context, page, search_url, label):
-    """Navigate to search_url with WAF captcha detection and one recovery attempt.
+def _block_resources(context, resource_types: frozenset[str]) -> None:
+    """Abort requests for the given resource types on every page in context."""
+    def _handle(route):
+        if route.request.resource_type in resource_types:
+            route.abort()
+        else:
+            route.continue_()
+
+    context.route("**/*", _handle)
+
+
+# ---------------------------------------------------------------------------
+# Browser pool: a few long-lived threads, each owning one Chromium launch
+# ---------------------------------------------------------------------------
+
+# Sync Playwright objects only work on the thread that started them, so all
+# browser work runs on _BrowserWorker threads (see _on_browser_thread).  Each
+# worker lazily launches its own driver + Chromium (_get_browser), keeps it
+# for the life of the process, and closes it on that same thread when
+# stopped.  Two workers let run.py's concurrent transcript fetches overlap.
+_BROWSER_WORKERS = 2
+
+_pool_local = threading.local()
+_pool_lock = threading.Lock()
+_workers: list[_BrowserWorker] = []
+_next_worker = itertools.count()
+
+
+def _have_playwright() -> bool:
+    try:
+        import playwright.sync_api  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_browser():
+    """Return this worker thread's Chromium browser, launching it on first use."""
+    browser = getattr(_pool_local, "browser", None)
+    if browser is not None:
+        if browser.is_connected():
+            return browser
+        # Chromium crashed or was closed: release the dead handle on this
+        # (owning) thread before relaunching on the same driver
+        try:
+            browser.close()
+        except Exception as exc:
+            log.debug("Error closing disconnected browser: %s", exc)
+
+    pw = getattr(_pool_local, "playwright", None)
+    if pw is None:
+        from playwright.sync_api import sync_playwright
+        pw = sync_playwright().start()
+        _pool_local.playwright = pw
+
+    browser = pw.chromium.launch(headless=True)
+    _pool_local.browser = browser
+    return browser
+
+
+def _close_thread_browser() -> None:
+    """Close this thread's browser and stop its Playwright driver."""
+    browser = getattr(_pool_local, "browser", None)
+    pw = getattr(_pool_local, "playwright", None)
+    _pool_local.__dict__.clear()
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception as exc:
+            log.debug("Error closing pooled browser: %s", exc)
+    if pw is not None:
+        try:
+            pw.stop()
+        except Exception as exc:
+            log.debug("Error stopping playwright: %s", exc)
+
+
+class _BrowserWorker:
+    """Daemon thread that runs submitted browser tasks one at a time."""
+
+    def __init__(self, name: str) -> None:
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        self._tasks.put((future, fn, args, kwargs))
+        return future
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Close the browser on the worker thread, then let the thread exit."""
+        self._tasks.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        _pool_local.is_worker = True
+        try:
+            while (task := self._tasks.get()) is not None:
+                future, fn, args, kwargs = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as exc:
+                    future.set_exception(exc)
+        finally:
+            _close_thread_browser()
+
+
+def _browser_workers(n: int = _BROWSER_WORKERS) -> list[_BrowserWorker]:
+    """Return the first n pooled workers, starting any that don't exist yet."""
+    n = max(1, min(n, _BROWSER_WORKERS))
+    with _pool_lock:
+        while len(_workers) < n:
+            _workers.append(_BrowserWorker(f"cspan-browser-{len(_workers)}"))
+        return _workers[:n]
+
 
-    Returns (browser, context, page, waf_blocked).  Callers must update their
-    local references since browser/context/page may be replaced on recovery.
+def _on_browser_thread(fn):
+    """Decorator: run fn on a pooled browser worker and wait for its result."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if getattr(_pool_local, "is_worker", False):
+            return fn(*args, **kwargs)
+        workers = _browser_workers()
+        worker = workers[next(_next_worker) % len(workers)]
+        return worker.submit(fn, *args, **kwargs).result()
+    return wrapper
+
+
+def _shutdown_pool() -> None:
+    """Stop every browser worker; each closes its own browser and driver."""
+    with _pool_lock:
+        workers = list(_workers)
+        _workers.clear()
+    for worker in workers:
+        worker.stop()
+
+
+atexit.register(_shutdown_pool)
+
+
+# Search pages only wait for domcontentloaded with heavy resources blocked, so
+# a navigation still pending after this long is a stall, not a slow page.
+_NAV_TIMEOUT_MS = 15000
+
+
+def _new_cspan_context(
+    blocked: frozenset[str] = _DISCOVERY_BLOCKED_RESOURCES,
+    storage_state: dict | None = None,
+):
+    """Open a fresh context + page on the pooled browser.
+
+    A new context has its own cookie jar, so it is also how WAF recovery gets
+    a clean session without relaunching Chromium.  Pass storage_state to carry
+    cookies (e.g. the CloudFront WAF token) over from a previous context;
+    otherwise the context is seeded from the persisted WAF cookie cache so a
+    warm run skips the JS challenge.
     """
-    page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-    page.wait_for_timeout(7000)
+    context = _get_browser().new_context(user_agent=_UA, storage_state=storage_state)
+    context.set_default_navigation_timeout(_NAV_TIMEOUT_MS)
+    if storage_state is None:
+        cookies = _load_waf_cookies()
+        if cookies:
+            context.add_cookies([
+                {"name": name, "value": value, "url": "https://www.c-span.org"}
+                for name, value in cookies.items()
+            ])
+    _block_resources(context, blocked)
+    page = context.new_page()
+    return context, page
+
+
+# Playwright's per-context heap only shrinks when the context is closed, so
+# long discovery loops swap in a new context every few pages.
+_CONTEXT_MAX_PAGES = 4
 
-    body_text = (page.inner_text("body") or "")[:300]
-    if "confirm you are human" not in body_text.lower():
-        return browser, context, page, False
 
-    log.info("C-SPAN %s: WAF captcha, cooldown 60s...", label)
+def _maybe_recycle_context(context, page, pages_loaded: int):
+    """Replace context/page every _CONTEXT_MAX_PAGES page loads.
+
+    Cookies are carried over via storage_state so the WAF token survives.
+    Returns (context, page) — possibly the same objects.
+    """
+    if pages_loaded == 0 or pages_loaded % _CONTEXT_MAX_PAGES != 0:
+        return context, page
+    storage_state = context.storage_state()
     context.close()
-    browser.close()
-    _time.sleep(60)
-    browser, context, page = _launch_cspan_browser(p)
-    _rate_limit()
-    page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-    page.wait_for_timeout(7000)
-    body_text = (page.inner_text("body") or "")[:300]
-    if "confirm you are human" in body_text.lower():
+    log.debug("C-SPAN: recycled browser context after %d pages", pages_loaded)
+    return _new_cspan_context(storage_state=storage_state)
+
+
+# Evaluated in the page so only a boolean crosses the IPC boundary instead of
+# the full serialized body text.
+_WAF_CHECK_JS = """
+    () => {
+        const body = document.body;
+        if (!body) return false;
+        return (body.innerText || '').slice(0, 300).toLowerCase()
+            .includes('confirm you are human');
+    }
+"""
+
+
+def _is_waf_challenge(page) -> bool:
+    """Return True if the current page is the CloudFront WAF captcha."""
+    return bool(page.evaluate(_WAF_CHECK_JS))
+
+
+# Resolves as soon as search results render or the WAF captcha shows up.
+_RESULTS_READY_JS = """
+    () => {
+        if (document.querySelector("a[href*='/program/'], a[href*='/event/']")) {
+            return true;
+        }
+        const body = document.body;
+        return !!body && (body.innerText || '').slice(0, 300).toLowerCase()
+            .includes('confirm you are human');
+    }
+"""
+
+_RESULTS_WAIT_MS = 7000  # upper bound; empty result pages still wait this long
+
+# Link count for the silent-block check; only a number crosses the IPC boundary.
+_RESULT_LINK_COUNT_JS = """
+    () => document.querySelectorAll("a[href*='/program/'], a[href*='/event/']").length
+"""
+
+
+def _wait_for_results(page) -> None:
+    """Wait until search results (or the WAF captcha) are in the DOM."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        page.wait_for_function(_RESULTS_READY_JS, timeout=_RESULTS_WAIT_MS)
+    except PlaywrightTimeoutError:
+        pass
+
+
+# After a captcha survives the recovery cooldown, WAF-limited searches are
+# skipped for this long — including by the next run, via state.
+_WAF_BLOCK_TTL = timedelta(minutes=10)
+
+
+def _waf_block_active(state, label: str) -> bool:
+    """True if state records a C-SPAN WAF block that has not expired yet."""
+    if state is None:
+        return False
+    until = state.get_cspan_waf_blocked_until()
+    if until is None or until <= datetime.now(timezone.utc):
+        return False
+    log.info("C-SPAN %s: WAF block in effect until %s, skipping",
+             label, until.isoformat(timespec="seconds"))
+    return True
+
+
+def _record_waf_block(state) -> None:
+    if state is not None:
+        state.record_cspan_waf_block(datetime.now(timezone.utc) + _WAF_BLOCK_TTL)
+
+
+def _navigate_with_waf_recovery(context, page, search_url, label, gate=None, stop=None):
+    """Navigate to search_url with WAF captcha detection and one recovery attempt.
+
+    Returns (context, page, waf_blocked).  Callers must update their local
+    references since context/page are replaced on recovery.
+
+    Concurrent callers pass their shared gate lock and stop event: the
+    recovery holds the gate, so no other search reaches C-SPAN during the
+    cooldown, and stop is set before the gate is released if the block
+    persists.
+    """
+    # The captcha check stays text-based; the response status is only logged
+    # until we know what status CloudFront serves the captcha page with.
+    resp = page.goto(search_url, wait_until="domcontentloaded")
+    _wait_for_results(page)
+
+    if not _is_waf_challenge(page):
+        _save_waf_cookies(context.cookies())
+        return context, page, False
+
+    # The cached token didn't get us through; recover with a clean jar
+    log.info("C-SPAN %s: WAF captcha (HTTP %s), cooldown 60s...",
+             label, resp.status if resp is not None else "?")
+    with gate if gate is not None else contextlib.nullcontext():
+        _clear_waf_cookies()
+        context.close()
+        _time.sleep(60)
+        context, page = _new_cspan_context()
+        _rate_limit()
+        page.goto(search_url, wait_until="domcontentloaded")
+        _wait_for_results(page)
+        blocked = _is_waf_challenge(page)
+        if blocked and stop is not None:
+            stop.set()
+    if blocked:
         log.warning("C-SPAN %s: WAF still blocked after cooldown", label)
-        return browser, context, page, True
+        return context, page, True
 
-    return browser, context, page, False
+    _save_waf_cookies(context.cookies())
+    return context, page, False
 
 
 def discover_cspan_targeted(
@@ -138,90 +434,182 @@ def discover_cspan_targeted(
     if not unmatched_hearings:
         return []
 
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
+    if not _have_playwright():
         log.warning("playwright not installed, skipping targeted C-SPAN search")
         return []
 
-    # Filter out already-searched hearings
-    to_search = []
-    for h in unmatched_hearings:
-        if state and state.is_cspan_searched(h["id"]):
-            continue
-        to_search.append(h)
+    # Filter out already-searched hearings (one state query for the batch)
+    to_search = unmatched_hearings
+    if state:
+        already = state.get_cspan_searched_ids([h["id"] for h in unmatched_hearings])
+        to_search = [h for h in unmatched_hearings if h["id"] not in already]
 
     if not to_search:
         log.info("C-SPAN targeted: all hearings already searched")
         return []
 
+    if _waf_block_active(state, "targeted"):
+        return []
+
     if len(to_search) > max_searches:
         log.info("C-SPAN targeted: capping from %d to %d (WAF budget)",
                  len(to_search), max_searches)
         to_search = to_search[:max_searches]
 
+    # Build search queries from title keywords; keywordless titles can't be searched
+    queue: list[tuple[str, str]] = []
+    by_id: dict[str, dict] = {}
+    searched: list[tuple[str, bool]] = []
+    for h in to_search:
+        keywords = _extract_search_keywords(h["title"])
+        if not keywords:
+            searched.append((h["id"], False))
+            continue
+        by_id[h["id"]] = h
+        queue.append((h["id"], _title_search_url(keywords)))
+
     cutoff = datetime.now(timezone.utc) - timedelta(days=30)  # generous for title matching
+    outcomes, searches_done, waf_blocked = _run_searches(queue, cutoff, "targeted")
+    if waf_blocked:
+        _record_waf_block(state)
+
     results: list[dict] = []
-    searches_done = 0
-    waf_blocked = False
+    for hearing_id, _ in queue:
+        if hearing_id not in outcomes:
+            continue  # never searched (WAF block) — retry next run
+        h = by_id[hearing_id]
+
+        # Match by date + keyword overlap
+        found = False
+        for sr in outcomes[hearing_id] or []:
+            if sr["date"] == h.get("date"):
+                sr["hearing_id"] = hearing_id
+                sr["committee_key"] = h.get("committee_key", "")
+                sr["cspan_url"] = sr["url"]
+                results.append(sr)
+                found = True
+                log.debug("C-SPAN targeted: matched '%s' -> %s",
+                          h["title"][:40], sr["program_id"])
+                break
 
-    with sync_playwright() as p:
-        browser, context, page = _launch_cspan_browser(p)
+        searched.append((hearing_id, found))
 
-        for h in to_search:
-            if waf_blocked:
-                break
+    if state:
+        state.record_cspan_title_searches(searched)
 
-            _batch_cooldown(searches_done, "targeted")
+    log.info("C-SPAN targeted: %d found from %d searches", len(results), searches_done)
+    return results
 
-            # Build search query from title keywords
-            keywords = _extract_search_keywords(h["title"])
-            if not keywords:
-                if state:
-                    state.record_cspan_title_search(h["id"], found=False)
-                continue
 
-            search_url = (
-                f"https://www.c-span.org/search/?query={quote_plus(keywords)}"
-                f"&searchtype=Videos&sort=Most+Recent+Event"
-            )
-            _rate_limit()
+# C-SPAN searches are spread over the browser workers, each driving its own
+# context on its own pooled browser.  Page-load starts still go through a
+# shared gate, so _rate_limit() and _batch_cooldown() pace the combined stream
+# exactly as a serial loop would; only the post-load wait and parsing overlap.
+_SEARCH_WORKERS = _BROWSER_WORKERS
 
-            try:
-                browser, context, page, waf_blocked = _navigate_with_waf_recovery(
-                    p, browser, context, page, search_url, "targeted")
-                searches_done += 1
-                if waf_blocked:
-                    break
+# Rotation aborts after this many consecutive empty searches with no result
+# links on the page (WAF silent block).
+_MAX_CONSECUTIVE_EMPTY = 4
 
-                search_results = _parse_search_results(page, cutoff)
-
-                # Match by date + keyword overlap
-                found = False
-                for sr in search_results:
-                    if sr["date"] == h.get("date"):
-                        sr["hearing_id"] = h["id"]
-                        sr["committee_key"] = h.get("committee_key", "")
-                        sr["cspan_url"] = sr["url"]
-                        results.append(sr)
-                        found = True
-                        log.debug("C-SPAN targeted: matched '%s' -> %s",
-                                  h["title"][:40], sr["program_id"])
-                        break
 
-                if state:
-                    state.record_cspan_title_search(h["id"], found=found)
+def _sponsor_search_url(cspan_id: str) -> str:
+    return (
+        f"https://www.c-span.org/search/?query=&searchtype=Videos"
+        f"&sponsorid%5B%5D={cspan_id}&sort=Most+Recent+Event"
+    )
 
-            except (TimeoutError, OSError, ValueError) as e:
-                log.warning("C-SPAN targeted search failed for '%s': %s",
-                            h["title"][:40], e)
-                if state:
-                    state.record_cspan_title_search(h["id"], found=False)
 
-        browser.close()
+def _title_search_url(keywords: str) -> str:
+    return (
+        f"https://www.c-span.org/search/?query={quote_plus(keywords)}"
+        f"&searchtype=Videos&sort=Most+Recent+Event"
+    )
 
-    log.info("C-SPAN targeted: %d found from %d searches", len(results), searches_done)
-    return results
+
+def _run_searches(
+    queue: list[tuple[str, str]],
+    cutoff: datetime,
+    label: str,
+    abort_on_empty: bool = False,
+    workers: int = _SEARCH_WORKERS,
+) -> tuple[dict[str, list[dict] | None], int, bool]:
+    """Load each (key, search_url) in queue and parse its results.
+
+    Returns (outcomes, searches_done, waf_blocked).  outcomes maps key to
+    the parsed hearings, or None if the search raised.  Keys that were never
+    searched (WAF block, silent-block abort) are absent.
+    """
+    # Base of playwright's TimeoutError, which is not the builtin one
+    from playwright.sync_api import Error as PlaywrightError
+
+    gate = threading.Lock()
+    stop = threading.Event()
+    waf_event = threading.Event()
+    outcomes: dict[str, list[dict] | None] = {}
+    searches_done = 0
+    consecutive_empty = 0
+
+    def _worker(stripe: list[tuple[str, str]]) -> None:
+        nonlocal searches_done, consecutive_empty
+        pages_loaded = 0
+        context, page = _new_cspan_context()
+        try:
+            for key, search_url in stripe:
+                with gate:
+                    if stop.is_set():
+                        break
+                    _batch_cooldown(searches_done, f"{label}/{key}")
+                    _rate_limit()
+                    searches_done += 1
+                context, page = _maybe_recycle_context(context, page, pages_loaded)
+                pages_loaded += 1
+
+                try:
+                    context, page, waf_blocked = _navigate_with_waf_recovery(
+                        context, page, search_url, f"{label}/{key}", gate, stop)
+                    if waf_blocked:
+                        waf_event.set()
+                        stop.set()
+                        break
+                    hearings = _parse_search_results(page, cutoff)
+                except (PlaywrightError, TimeoutError, OSError, ValueError) as e:
+                    log.warning("C-SPAN %s search failed for %s: %s", label, key, e)
+                    outcomes[key] = None
+                    continue
+
+                outcomes[key] = hearings
+                if not abort_on_empty:
+                    continue
+                with gate:
+                    consecutive_empty = 0 if hearings else consecutive_empty + 1
+                    if consecutive_empty < _MAX_CONSECUTIVE_EMPTY:
+                        continue
+                if not page.evaluate(_RESULT_LINK_COUNT_JS):
+                    log.warning("C-SPAN %s: %d consecutive empty — "
+                                "likely WAF silent block, aborting",
+                                label, consecutive_empty)
+                    stop.set()
+                    break
+        except PlaywrightError as e:
+            # Context recycling or the silent-block probe failed outside the
+            # per-search guard: drop this stripe rather than the whole run
+            log.warning("C-SPAN %s search worker stopped: %s", label, e)
+        finally:
+            with contextlib.suppress(PlaywrightError):
+                context.close()
+
+    # Stripes run on the persistent browser workers, so their Chromium
+    # launches are reused by later searches and transcript fetches
+    n_workers = max(1, min(workers, len(queue), _BROWSER_WORKERS))
+    stripes = [queue[i::n_workers] for i in range(n_workers)]
+    futures = [
+        worker.submit(_worker, stripe)
+        for worker, stripe in zip(_browser_workers(n_workers), stripes)
+    ]
+    for future in futures:
+        future.result()
+
+    return outcomes, searches_done, waf_event.is_set()
 
 
 def discover_cspan_rotation(
@@ -243,127 +631,79 @@ def discover_cspan_rotation(
     Returns:
         [{title, date, url, program_id, committee_key}, ...] — flat list.
     """
-    cspan_committees = [
-        (key, meta) for key, meta in committees.items()
+    cspan_committees = {
+        key: meta for key, meta in committees.items()
         if meta.get("cspan_id")
-    ]
+    }
 
     if not cspan_committees:
         log.info("No committees to check on C-SPAN")
         return []
 
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
+    if not _have_playwright():
         log.warning("playwright not installed, skipping C-SPAN rotation")
         return []
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-    all_results: list[dict] = []
-    seen_ids: set[str] = set()
-    searches_done = 0
-    waf_blocked = False
-
-    with sync_playwright() as p:
-        browser, context, page = _launch_cspan_browser(p)
-
-        def _search_committee(cspan_id: str, label: str) -> list[dict]:
-            nonlocal searches_done, waf_blocked, context, page, browser
-
-            _batch_cooldown(searches_done, f"rotation/{label}")
+    if _waf_block_active(state, "rotation"):
+        return []
 
-            search_url = (
-                f"https://www.c-span.org/search/?query=&searchtype=Videos"
-                f"&sponsorid%5B%5D={cspan_id}&sort=Most+Recent+Event"
-            )
-            _rate_limit()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-            try:
-                browser, context, page, waf_blocked = _navigate_with_waf_recovery(
-                    p, browser, context, page, search_url, f"rotation/{label}")
-                searches_done += 1
-                if waf_blocked:
-                    return []
+    # Build rotation queue: stale or never-searched committees
+    search_queue: list[tuple[str, dict]] = []
+
+    if state:
+        # One query for every search age instead of one per committee
+        never_searched = cspan_committees.keys() - state.get_all_cspan_search_ages().keys()
+        stale = state.get_stale_committees(max_age_days=5)
+
+        queued: set[str] = set()
+        for key in [*sorted(never_searched), *stale]:
+            meta = cspan_committees.get(key)
+            if meta and key not in queued:
+                queued.add(key)
+                search_queue.append((key, meta))
+    else:
+        # Without state, search all committees (legacy behavior)
+        search_queue = list(cspan_committees.items())
+
+    if len(search_queue) > _MAX_CSPAN_SEARCHES:
+        log.info("C-SPAN rotation: capping from %d to %d",
+                 len(search_queue), _MAX_CSPAN_SEARCHES)
+        search_queue = search_queue[:_MAX_CSPAN_SEARCHES]
+
+    if not search_queue:
+        log.info("C-SPAN rotation: no stale committees to search")
+        return []
 
-                return _parse_search_results(page, cutoff)
+    log.info("C-SPAN rotation: searching %d stale committees", len(search_queue))
 
-            except (TimeoutError, OSError, ValueError) as e:
-                log.warning("C-SPAN rotation search failed for %s: %s", label, e)
-                return []
+    outcomes, searches_done, waf_blocked = _run_searches(
+        [(key, _sponsor_search_url(meta["cspan_id"])) for key, meta in search_queue],
+        cutoff, "rotation", abort_on_empty=True)
+    if waf_blocked:
+        _record_waf_block(state)
 
-        # Build rotation queue: stale or never-searched committees
-        search_queue: list[tuple[str, dict]] = []
+    all_results: list[dict] = []
+    seen_ids: set[str] = set()
+    for key, _ in search_queue:
+        if key not in outcomes:
+            continue
+        new = 0
+        for h in outcomes[key] or []:
+            if h["program_id"] not in seen_ids:
+                seen_ids.add(h["program_id"])
+                h["committee_key"] = key
+                all_results.append(h)
+                new += 1
 
         if state:
-            all_cspan_keys = {key for key, _ in cspan_committees}
-            cspan_meta = {key: meta for key, meta in cspan_committees}
-
-            never_searched = [
-                key for key in all_cspan_keys
-                if state.get_cspan_search_age(key) is None
-            ]
-            stale = state.get_stale_committees(max_age_days=5)
-
-            rotation = never_searched + [k for k in stale if k not in never_searched]
-            for key in rotation:
-                meta = cspan_meta.get(key)
-                if meta:
-                    search_queue.append((key, meta))
-        else:
-            # Without state, search all committees (legacy behavior)
-            search_queue = list(cspan_committees)
-
-        if len(search_queue) > _MAX_CSPAN_SEARCHES:
-            log.info("C-SPAN rotation: capping from %d to %d",
-                     len(search_queue), _MAX_CSPAN_SEARCHES)
-            search_queue = search_queue[:_MAX_CSPAN_SEARCHES]
-
-        if not search_queue:
-            log.info("C-SPAN rotation: no stale committees to search")
-            browser.close()
-            return []
-
-        log.info("C-SPAN rotation: searching %d stale committees", len(search_queue))
-
-        consecutive_empty = 0
-        for key, meta in search_queue:
-            if waf_blocked:
-                break
-
-            cspan_id = meta["cspan_id"]
-            hearings = _search_committee(cspan_id, key)
-            if waf_blocked:
-                break
-
-            new = 0
-            for h in hearings:
-                if h["program_id"] not in seen_ids:
-                    seen_ids.add(h["program_id"])
-                    h["committee_key"] = key
-                    all_results.append(h)
-                    new += 1
-
-            if state:
-                state.record_cspan_search(key, new)
+            state.record_cspan_search(key, new)
 
-            if new:
-                consecutive_empty = 0
-                log.info("  C-SPAN rotation %s: %d hearings", key, new)
-            else:
-                consecutive_empty += 1
-                log.debug("  C-SPAN rotation %s: no recent hearings", key)
-                if consecutive_empty >= 4:
-                    raw_links = page.query_selector_all(
-                        "a[href*='/program/'], a[href*='/event/']"
-                    )
-                    if len(raw_links) == 0:
-                        log.warning("C-SPAN rotation: %d consecutive empty — "
-                                    "likely WAF silent block, aborting",
-                                    consecutive_empty)
-                        break
-
-        browser.close()
+        if new:
+            log.info("  C-SPAN rotation %s: %d hearings", key, new)
+        else:
+            log.debug("  C-SPAN rotation %s: no recent hearings", key)
 
     log.info("C-SPAN rotation: %d hearings from %d searches",
              len(all_results), searches_done)
@@ -409,67 +749,94 @@ def discover_cspan_by_committee(
                  len(to_search), max_searches)
         to_search = to_search[:max_searches]
 
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
+    if not _have_playwright():
         log.warning("playwright not installed, skipping C-SPAN by-committee search")
         return []
 
+    if _waf_block_active(state, "by-committee"):
+        return []
+
     cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    outcomes, searches_done, waf_blocked = _run_searches(
+        [(key, _sponsor_search_url(meta["cspan_id"])) for key, meta in to_search],
+        cutoff, "by-committee")
+    if waf_blocked:
+        _record_waf_block(state)
+
     all_results: list[dict] = []
     seen_ids: set[str] = set()
-    searches_done = 0
-    waf_blocked = False
-
-    with sync_playwright() as p:
-        browser, context, page = _launch_cspan_browser(p)
-
-        for key, meta in to_search:
-            if waf_blocked:
-                break
-
-            _batch_cooldown(searches_done, "by-committee")
+    for key, _ in to_search:
+        hearings = outcomes.get(key)
+        if hearings is None:
+            continue
+        new = 0
+        for h in hearings:
+            if h["program_id"] not in seen_ids:
+                seen_ids.add(h["program_id"])
+                h["committee_key"] = key
+                all_results.append(h)
+                new += 1
 
-            cspan_id = meta["cspan_id"]
-            search_url = (
-                f"https://www.c-span.org/search/?query=&searchtype=Videos"
-                f"&sponsorid%5B%5D={cspan_id}&sort=Most+Recent+Event"
-            )
-            _rate_limit()
+        if state:
+            state.record_cspan_search(key, new)
 
-            try:
-                browser, context, page, waf_blocked = _navigate_with_waf_recovery(
-                    p, browser, context, page, search_url, f"by-committee/{key}")
-                searches_done += 1
-                if waf_blocked:
-                    break
+        if new:
+            log.info("  C-SPAN by-committee %s: %d hearings", key, new)
+        else:
+            log.debug("  C-SPAN by-committee %s: no recent hearings", key)
 
-                hearings = _parse_search_results(page, cutoff)
+    log.info("C-SPAN by-committee: %d hearings from %d searches",
+             len(all_results), searches_done)
+    return all_results
 
-                new = 0
-                for h in hearings:
-                    if h["program_id"] not in seen_ids:
-                        seen_ids.add(h["program_id"])
-                        h["committee_key"] = key
-                        all_results.append(h)
-                        new += 1
 
-                if state:
-                    state.record_cspan_search(key, new)
+_MONTHS = {
+    "JANUARY": 1, "FEBRUARY": 2, "MARCH": 3, "APRIL": 4, "MAY": 5, "JUNE": 6,
+    "JULY": 7, "AUGUST": 8, "SEPTEMBER": 9, "OCTOBER": 10, "NOVEMBER": 11,
+    "DECEMBER": 12,
+}
+_RESULT_DATE_RE = re.compile(
+    rf"({'|'.join(_MONTHS)})\s+(\d{{1,2}}),?\s+(\d{{4}})"
+)
 
-                if new:
-                    log.info("  C-SPAN by-committee %s: %d hearings", key, new)
-                else:
-                    log.debug("  C-SPAN by-committee %s: no recent hearings", key)
 
-            except (TimeoutError, OSError, ValueError) as e:
-                log.warning("C-SPAN by-committee search failed for %s: %s", key, e)
+def _parse_result_date(text: str) -> datetime | None:
+    """Parse the first "FEBRUARY 5, 2026"-style date in text as a UTC datetime."""
+    date_match = _RESULT_DATE_RE.search(text)
+    if not date_match:
+        return None
+    # Month name is constrained by the regex; only day/year can be out of range
+    try:
+        return datetime(
+            int(date_match.group(3)),
+            _MONTHS[date_match.group(1)],
+            int(date_match.group(2)),
+            tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
 
-        browser.close()
 
-    log.info("C-SPAN by-committee: %d hearings from %d searches",
-             len(all_results), searches_done)
-    return all_results
+# Collects every program/event link with its text and the first date in its
+# parent's text in a single IPC roundtrip (instead of three or four Playwright
+# calls per link).  The date is matched in the page with the same pattern as
+# _RESULT_DATE_RE, so only that short string crosses IPC, not the parent text.
+_SEARCH_ROWS_JS = """
+    () => {
+        const dateRe = /(?:%s)\\s+\\d{1,2},?\\s+\\d{4}/;
+        return Array.from(
+            document.querySelectorAll("a[href*='/program/'], a[href*='/event/']")
+        ).map(a => {
+            const parent = a.parentElement;
+            const m = parent ? (parent.innerText || '').match(dateRe) : null;
+            return {
+                href: a.getAttribute('href') || '',
+                text: a.innerText || '',
+                dateText: parent ? (m ? m[0] : '') : null,
+            };
+        });
+    }
+""" % "|".join(_MONTHS)
 
 
 def _parse_search_results(page, cutoff: datetime) -> list[dict]:
@@ -480,15 +847,20 @@ def _parse_search_results(page, cutoff: datetime) -> list[dict]:
         LAST AIRED FEBRUARY 7, 2026
         Treasury Secy. Bessent Testifies Before Congress
     """
-    hearings = []
-    seen_program_ids = set()
+    return _parse_search_rows(page.evaluate(_SEARCH_ROWS_JS) or [], cutoff)
 
-    # Find all program/event links (each result has two: image + title)
-    items = page.query_selector_all("a[href*='/program/'], a[href*='/event/']")
 
-    for item in items:
+def _parse_search_rows(rows: list[dict], cutoff: datetime) -> list[dict]:
+    """Turn [{href, text, dateText}, ...] link rows into hearing dicts."""
+    hearings = []
+    # Program IDs stay strings: they are only compared, never computed on, and
+    # str hashes are cached, so int() per row would cost more than it saves.
+    seen_program_ids: set[str] = set()
+
+    # Each result has two links (image + title)
+    for row in rows:
         try:
-            href = item.get_attribute("href") or ""
+            href = row.get("href") or ""
             if "/program/" not in href and "/event/" not in href:
                 continue
 
@@ -499,7 +871,7 @@ def _parse_search_results(page, cutoff: datetime) -> list[dict]:
                 href = "https://www.c-span.org" + href
 
             # Get title from link text — skip image links (empty text)
-            title = (item.inner_text() or "").strip()
+            title = (row.get("text") or "").strip()
             if not title or len(title) < 10:
                 continue
 
@@ -514,30 +886,13 @@ def _parse_search_results(page, cutoff: datetime) -> list[dict]:
                 continue
             seen_program_ids.add(program_id)
 
-            # Get date from parent element text
-            parent = item.query_selector("xpath=..")
-            if not parent:
-                continue
-            parent_text = (parent.inner_text() or "").strip()
-
-            # First date line is the event date (e.g., "FEBRUARY 5, 2026")
-            date_match = re.search(
-                r"(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|"
-                r"SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+(\d{1,2}),?\s+(\d{4})",
-                parent_text,
-            )
-            if not date_match:
+            # Date was pulled from the parent element's text in the page
+            date_text = row.get("dateText")
+            if date_text is None:
                 continue
 
-            month_str = date_match.group(1).capitalize()
-            day = int(date_match.group(2))
-            year = int(date_match.group(3))
-            try:
-                date_obj = datetime.strptime(f"{month_str} {day} {year}", "%B %d %Y")
-            except ValueError:
-                continue
-
-            if date_obj < cutoff:
+            date_obj = _parse_result_date(date_text)
+            if date_obj is None or date_obj < cutoff:
                 continue
 
             hearings.append({
@@ -559,14 +914,40 @@ def _parse_search_results(page, cutoff: datetime) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 _DDG_DELAY = 4.0  # seconds between DDG searches (avoid 202 rate limits)
+_DDG_WORKERS = 3
+_ddg_limiter = RateLimiter(min_delay=_DDG_DELAY)
+
 
+@functools.lru_cache(maxsize=2048)
 def _extract_search_keywords(title: str, max_words: int = 5) -> str:
-    """Extract significant keywords from a hearing title for search."""
-    words = re.sub(r"[^a-z0-9\s]", "", title.lower()).split()
+    """Extract significant keywords from a hearing title for search.
+
+    Cached: the same unmatched titles go through every discovery step.
+    """
+    words = _NON_ALNUM_RE.sub("", title.lower()).split()
     significant = [w for w in words if len(w) >= 3 and w not in TITLE_STOPWORDS]
     return " ".join(significant[:max_words])
 
 
+# Only result anchors are built into a tree; the rest of the page is skipped.
+_DDG_ANCHORS = SoupStrainer("a", href=True)
+
+
+def _ddg_result_urls(html: str) -> Iterator[str]:
+    """Yield C-SPAN program/event URLs from DDG result links, in page order.
+
+    DDG's HTML endpoint wraps results in ``/l/?uddg=<url>`` redirects; those
+    are unwrapped.  URLs that only appear in scripts or text are ignored.
+    """
+    for a in BeautifulSoup(html, "lxml", parse_only=_DDG_ANCHORS).find_all("a"):
+        href = a["href"]
+        if "uddg=" in href:
+            href = parse_qs(urlparse(href).query).get("uddg", [href])[0]
+        m = _CSPAN_URL_RE.match(href)
+        if m:
+            yield m.group(0)
+
+
 def discover_cspan_google(
     hearings: list[dict],
     max_searches: int = 200,
@@ -588,11 +969,11 @@ def discover_cspan_google(
     if not hearings:
         return []
 
-    results: list[dict] = []
-    searches = 0
-
+    # Build queries up front; only hearings with something to search count
+    # against the cap.
+    queries: list[tuple[dict, str, str]] = []
     for h in hearings:
-        if searches >= max_searches:
+        if len(queries) >= max_searches:
             log.info("DDG C-SPAN: hit search cap (%d)", max_searches)
             break
 
@@ -609,14 +990,9 @@ def discover_cspan_google(
                           "committee name)", h["title"][:50])
                 continue
 
-        # Add year context for relevance
-        date_str = h.get("date", "")
-        year = ""
-        if date_str:
-            try:
-                year = datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y")
-            except ValueError:
-                pass
+        # Add year context for relevance (dates are ISO YYYY-MM-DD)
+        date_str = h.get("date") or ""
+        year = date_str[:4] if len(date_str) >= 4 and date_str[:4].isdigit() else ""
 
         # Use committee name instead of generic "c-span.org/program"
         if committee_name:
@@ -626,24 +1002,24 @@ def discover_cspan_google(
         if year:
             query += f" {year}"
 
-        _time.sleep(_DDG_DELAY)
-        searches += 1
-
-        def _ddg_post(q: str) -> httpx.Response:
-            if client is not None:
-                return client.post(
-                    "https://html.duckduckgo.com/html/",
-                    data={"q": q},
-                    headers={"User-Agent": _UA},
-                )
-            return httpx.post(
-                "https://html.duckduckgo.com/html/",
-                data={"q": q},
-                headers={"User-Agent": _UA},
-                follow_redirects=True,
-                timeout=15.0,
-            )
+        queries.append((h, query, keywords))
+
+    # One keep-alive connection for the whole run instead of a TLS handshake
+    # per query; a caller-supplied client is left open for the caller.
+    owns_client = client is None
+    if owns_client:
+        client = httpx.Client(follow_redirects=True, timeout=15.0)
 
+    def _ddg_post(q: str) -> httpx.Response:
+        _ddg_limiter.wait("html.duckduckgo.com")
+        return client.post(
+            "https://html.duckduckgo.com/html/",
+            data={"q": q},
+            headers={"User-Agent": _UA},
+        )
+
+    def _search_one(item: tuple[dict, str, str]) -> dict | None:
+        h, query, keywords = item
         try:
             resp = _ddg_post(query)
             if resp.status_code == 202:
@@ -654,47 +1030,40 @@ def discover_cspan_google(
             if resp.status_code != 200:
                 log.debug("DDG search returned %d for '%s'",
                           resp.status_code, keywords[:40])
-                continue
+                return None
 
-            # Extract C-SPAN program/event URLs from DDG HTML results
-            raw_urls = re.findall(
-                r"https?://www\.c-span\.org/(?:program|event)/[^\s\"'<>&]+",
-                resp.text,
-            )
-            # Decode HTML entities and deduplicate
-            seen: set[str] = set()
-            cspan_url = None
-            program_id = None
-            for raw in raw_urls:
-                url = raw.replace("&amp;", "&")
+            # Take the first (most relevant) C-SPAN result
+            for url in _ddg_result_urls(resp.text):
                 m = _CSPAN_PROGRAM_ID_RE.search(url)
                 if not m:
                     continue
-                pid = m.group(1)
-                if pid in seen:
-                    continue
-                seen.add(pid)
-                cspan_url = url
-                program_id = pid
-                break  # take first (most relevant) result
-
-            if cspan_url and program_id:
-                results.append({
-                    "hearing_id": h["id"],
-                    "cspan_url": cspan_url,
-                    "program_id": program_id,
-                })
                 log.debug("DDG C-SPAN: found %s for '%s'",
-                          program_id, h["title"][:50])
-            else:
-                log.debug("DDG C-SPAN: no match for '%s'", h["title"][:50])
+                          m.group(1), h["title"][:50])
+                return {
+                    "hearing_id": h["id"],
+                    "cspan_url": url,
+                    "program_id": m.group(1),
+                }
+            log.debug("DDG C-SPAN: no match for '%s'", h["title"][:50])
 
         except (httpx.HTTPError, OSError, ValueError) as e:
             log.debug("DDG search error for '%s': %s", keywords[:30], e)
-            continue
+        return None
+
+    # Request starts stay _DDG_DELAY apart across all workers, so DDG sees
+    # the same rate as the old serial loop; only response waits overlap.
+    results: list[dict] = []
+    try:
+        with ThreadPoolExecutor(max_workers=_DDG_WORKERS) as pool:
+            for found in pool.map(_search_one, queries):
+                if found:
+                    results.append(found)
+    finally:
+        if owns_client:
+            client.close()
 
     log.info("DDG C-SPAN: %d found from %d searches (%d hearings queried)",
-             len(results), searches, len(hearings))
+             len(results), len(queries), len(hearings))
     return results
 
 
@@ -702,6 +1071,170 @@ def discover_cspan_google(
 # C-SPAN transcript extraction via JSON API
 # ---------------------------------------------------------------------------
 
+_TRANSCRIPT_API_URL = "https://www.c-span.org/common/services/transcript/"
+
+# CloudFront WAF cookies harvested from a successful browser page load.  While
+# they stay valid, transcript JSON can be fetched with a plain HTTP GET instead
+# of a full Playwright page load.  Persisted to config.CSPAN_COOKIES_JSON so
+# they survive across runs until CloudFront expires them.
+_cookie_lock = threading.Lock()
+_waf_cookies: dict[str, str] | None = None
+
+
+def _load_waf_cookies() -> dict[str, str]:
+    """Return cached C-SPAN cookies (name -> value), loading from disk once."""
+    global _waf_cookies
+    with _cookie_lock:
+        if _waf_cookies is None:
+            _waf_cookies = {}
+            try:
+                with open(config.CSPAN_COOKIES_JSON, encoding="utf-8") as f:
+                    saved = json.load(f)
+                now = _time.time()
+                _waf_cookies = {
+                    c["name"]: c["value"] for c in saved
+                    if c.get("expires", -1) < 0 or c["expires"] > now
+                }
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                log.debug("Ignoring unreadable C-SPAN cookie cache: %s", e)
+        return dict(_waf_cookies)
+
+
+def _save_waf_cookies(cookies: list[dict]) -> None:
+    """Cache c-span.org cookies from a Playwright context, in memory and on disk."""
+    global _waf_cookies
+    keep = [
+        {"name": c["name"], "value": c["value"], "expires": c.get("expires", -1)}
+        for c in cookies if "c-span.org" in c.get("domain", "")
+    ]
+    if not keep:
+        return
+    with _cookie_lock:
+        _waf_cookies = {c["name"]: c["value"] for c in keep}
+        path = config.CSPAN_COOKIES_JSON
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(tmp_fd, 'w') as f:
+                    json.dump(keep, f)
+                os.replace(tmp_path, path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            log.debug("Could not persist C-SPAN cookie cache: %s", e)
+
+
+def _clear_waf_cookies() -> None:
+    global _waf_cookies
+    with _cookie_lock:
+        _waf_cookies = {}
+        try:
+            config.CSPAN_COOKIES_JSON.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.debug("Could not remove C-SPAN cookie cache: %s", e)
+
+
+def _fetch_transcript_direct(program_id: str) -> str | None:
+    """Fetch transcript JSON over plain HTTP using cached WAF cookies.
+
+    Returns the raw JSON text, or None if there are no cached cookies or the
+    WAF rejected them (in which case the cache is dropped).
+    """
+    cookies = _load_waf_cookies()
+    if not cookies:
+        return None
+
+    _rate_limit()
+    try:
+        resp = httpx.get(
+            _TRANSCRIPT_API_URL,
+            params={
+                "videoId": program_id,
+                "videoType": "program",
+                "transcriptType": "cc",
+                "transcriptQuery": "",
+            },
+            cookies=cookies,
+            headers={"User-Agent": _UA, "Referer": "https://www.c-span.org/"},
+            follow_redirects=True,
+            timeout=20.0,
+        )
+    except httpx.HTTPError as e:
+        log.debug("Direct C-SPAN transcript fetch failed for %s: %s", program_id, e)
+        return None
+
+    if resp.status_code in (202, 403):
+        log.info("C-SPAN WAF rejected cached cookies (%d), falling back to browser",
+                 resp.status_code)
+        _clear_waf_cookies()
+        return None
+    if resp.status_code != 200:
+        return None
+
+    # A WAF challenge page can come back as 200 HTML — only accept a JSON
+    # object (parsed later, streaming, by _iter_transcript_parts)
+    text = resp.text
+    if not text.lstrip().startswith("{"):
+        _clear_waf_cookies()
+        return None
+    return text
+
+
+@_on_browser_thread
+def _fetch_transcript_browser(video_url: str, program_id: str) -> str | None:
+    """Load the program page in a browser and fetch transcript JSON from it.
+
+    The page load passes the CloudFront WAF; its cookies are cached so later
+    transcripts can skip the browser via _fetch_transcript_direct().
+    """
+    from playwright.sync_api import Error as PlaywrightError
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    transcript_json = None
+    context, page = _new_cspan_context(_TRANSCRIPT_BLOCKED_RESOURCES)
+    try:
+        _rate_limit()
+        page.goto(video_url, wait_until="domcontentloaded", timeout=45000)
+        # Let the WAF challenge script settle; capped at the old fixed wait
+        try:
+            page.wait_for_load_state("networkidle", timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
+
+        # Fetch transcript API from within the page context (same-origin,
+        # passes CloudFront WAF cookie automatically)
+        transcript_json = page.evaluate("""
+            async (programId) => {
+                try {
+                    const resp = await fetch(
+                        '/common/services/transcript/?videoId=' + programId
+                        + '&videoType=program&transcriptType=cc&transcriptQuery='
+                    );
+                    if (!resp.ok) return null;
+                    return await resp.text();
+                } catch (e) {
+                    return null;
+                }
+            }
+        """, program_id)
+
+        if transcript_json:
+            _save_waf_cookies(context.cookies())
+
+    except (PlaywrightError, TimeoutError, OSError) as e:
+        log.warning("Error loading C-SPAN page %s: %s", video_url, e)
+    finally:
+        context.close()
+
+    return transcript_json
+
+
 def fetch_cspan_transcript(
     video_url: str,
     output_dir: Path,
@@ -709,8 +1242,9 @@ def fetch_cspan_transcript(
 ) -> Path | None:
     """Fetch C-SPAN transcript via the internal JSON API.
 
-    Loads the program page (to pass CloudFront WAF), then fetches the
-    transcript API endpoint from within the page context.
+    Uses cached CloudFront WAF cookies for a direct HTTP request when
+    possible; otherwise loads the program page (to pass the WAF) and fetches
+    the transcript API endpoint from within the page context.
 
     Args:
         video_url: C-SPAN program URL (e.g., https://www.c-span.org/program/.../672588)
@@ -721,83 +1255,60 @@ def fetch_cspan_transcript(
         Path to transcript file, or None if transcript not available
     """
     # Extract program ID from URL
-    prog_match = re.search(r"/(\d+)/?$", video_url)
+    prog_match = _TRAILING_ID_RE.search(video_url)
     if not prog_match:
         log.warning("Cannot extract program ID from URL: %s", video_url)
         return None
     program_id = prog_match.group(1)
 
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        log.warning("playwright not installed, cannot fetch C-SPAN transcript")
-        return None
-
     log.info("Fetching C-SPAN transcript for program %s", program_id)
-    transcript_json = None
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(user_agent=_UA)
-        page = context.new_page()
+    transcript_json = _fetch_transcript_direct(program_id)
+    if transcript_json is None:
+        if not _have_playwright():
+            log.warning("playwright not installed, cannot fetch C-SPAN transcript")
+            return None
 
-        try:
-            _rate_limit()
-            page.goto(video_url, wait_until="domcontentloaded", timeout=45000)
-            page.wait_for_timeout(5000)
-
-            # Fetch transcript API from within the page context (same-origin,
-            # passes CloudFront WAF cookie automatically)
-            transcript_json = page.evaluate("""
-                async (programId) => {
-                    try {
-                        const resp = await fetch(
-                            '/common/services/transcript/?videoId=' + programId
-                            + '&videoType=program&transcriptType=cc&transcriptQuery='
-                        );
-                        if (!resp.ok) return null;
-                        return await resp.text();
-                    } catch (e) {
-                        return null;
-                    }
-                }
-            """, program_id)
+        transcript_json = _fetch_transcript_browser(video_url, program_id)
+        if not transcript_json:
+            log.info("No transcript available for program %s", program_id)
+            return None
 
-        except (TimeoutError, OSError) as e:
-            log.warning("Error loading C-SPAN page %s: %s", video_url, e)
-        finally:
-            browser.close()
+    # Build readable transcript from parts, parsed one part at a time
+    n_parts = 0
 
-    if not transcript_json:
-        log.info("No transcript available for program %s", program_id)
-        return None
+    def _counted(parts: Iterable[dict]) -> Iterator[dict]:
+        nonlocal n_parts
+        for part in parts:
+            n_parts += 1
+            yield part
 
-    # Parse JSON
+    # Stream the transcript straight into a temp file (atomic: temp + rename)
+    # so the full text is never held in memory alongside the JSON
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / "cspan_transcript.txt"
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.tmp')
     try:
-        data = json.loads(transcript_json)
-    except (json.JSONDecodeError, TypeError):
+        with os.fdopen(tmp_fd, 'w', buffering=1 << 16) as f:
+            n_chars = _write_transcript(
+                _counted(_iter_transcript_parts(transcript_json)), f)
+    except _TRANSCRIPT_JSON_ERRORS:
+        os.unlink(tmp_path)
         log.warning("Invalid transcript JSON for program %s", program_id)
         return None
+    except Exception:
+        os.unlink(tmp_path)
+        raise
 
-    parts = data.get("parts")
-    if not parts:
-        log.info("Transcript has no parts for program %s", program_id)
-        return None
-
-    # Build readable transcript from parts
-    transcript = _build_transcript(parts)
-
-    if not transcript.strip():
-        log.warning("Empty transcript after processing for program %s", program_id)
+    if not n_parts or not n_chars:
+        os.unlink(tmp_path)
+        if not n_parts:
+            log.info("Transcript has no parts for program %s", program_id)
+        else:
+            log.warning("Empty transcript after processing for program %s", program_id)
         return None
 
-    # Write transcript (atomic: temp file + rename)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / "cspan_transcript.txt"
-    tmp_fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.tmp')
     try:
-        with os.fdopen(tmp_fd, 'w') as f:
-            f.write(transcript)
         os.replace(tmp_path, output_path)
     except Exception:
         os.unlink(tmp_path)
@@ -805,7 +1316,7 @@ def fetch_cspan_transcript(
 
     log.info(
         "C-SPAN transcript: %d chars, %d segments -> %s",
-        len(transcript), len(parts), output_path,
+        n_chars, n_parts, output_path,
     )
     return output_path
 
@@ -814,43 +1325,93 @@ def fetch_cspan_transcript(
 # Transcript processing
 # ---------------------------------------------------------------------------
 
-def _build_transcript(parts: list[dict]) -> str:
-    """Build a readable transcript from C-SPAN API parts.
+# ijson is optional: with it, long hearings are parsed one part at a time
+# instead of materializing every part dict up front.
+try:
+    import ijson
+    _TRANSCRIPT_JSON_ERRORS: tuple[type[Exception], ...] = (
+        ValueError, TypeError, AttributeError, ijson.JSONError,
+    )
+except ImportError:
+    ijson = None
+    _TRANSCRIPT_JSON_ERRORS = (ValueError, TypeError, AttributeError)
+
+# Without ijson the whole response is parsed at once; orjson (also optional,
+# its JSONDecodeError is a ValueError) does that several times faster.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _iter_transcript_parts(transcript_json: str) -> Iterator[dict]:
+    """Yield the "parts" entries of a transcript API response."""
+    if ijson is not None:
+        return ijson.items(io.BytesIO(transcript_json.encode("utf-8")), "parts.item",
+                           use_float=True)
+    if orjson is not None:
+        return iter(orjson.loads(transcript_json).get("parts") or [])
+    return iter(json.loads(transcript_json).get("parts") or [])
+
+
+def _build_transcript(parts: Iterable[dict]) -> str:
+    """Build a readable transcript from C-SPAN API parts as a string."""
+    buf = io.StringIO()
+    _write_transcript(parts, buf)
+    return buf.getvalue()
+
+
+def _write_transcript(parts: Iterable[dict], out: TextIO) -> int:
+    """Write a readable transcript from C-SPAN API parts to out.
 
     Each part has: cc_name (speaker label), personid, text (ALL CAPS),
-    secAppOffset (seconds from start).
+    secAppOffset (seconds from start).  Every part is its own paragraph,
+    separated by a blank line: llm_utils.split_into_chunks only splits there.
+    Returns the number of characters written.
     """
-    sections = []
+    written = 0
     prev_speaker = None
 
+    # Bind hot-loop lookups to locals (runs once per caption part)
+    get = dict.get
+    write = out.write
+    normalize = _normalize_caps
+    join = " ".join
+    intern = sys.intern
+
     for part in parts:
-        text = (part.get("text") or "").strip()
+        text = (get(part, "text") or "").strip()
         if not text:
             continue
 
-        # Clean up the text
-        text = _normalize_caps(text)
-        # Collapse internal line breaks from caption formatting
-        text = _NEWLINE_RE.sub(" ", text)
-        text = _MULTI_SPACE_RE.sub(" ", text).strip()
+        # Clean up the text: split()/join collapses caption line breaks and
+        # runs of whitespace to single spaces and strips, all in C
+        text = join(normalize(text).split())
 
         # Determine speaker label
-        speaker = (part.get("cc_name") or "").strip()
+        speaker = (get(part, "cc_name") or "").strip()
         if speaker == ">>" or not speaker:
             speaker = None
+        else:
+            # Labels repeat across hundreds of parts; interned copies compare
+            # by identity against prev_speaker
+            speaker = intern(speaker)
 
+        sep = "\n\n" if written else ""
         if speaker and speaker != prev_speaker:
-            sections.append(f"\n{speaker}:\n{text}")
+            chunk = f"{sep}\n{speaker}:\n{text}"
             prev_speaker = speaker
         elif not speaker and prev_speaker:
             # New unlabeled speaker segment — mark transition
-            sections.append(f"\n[SPEAKER]:\n{text}")
+            chunk = f"{sep}\n[SPEAKER]:\n{text}"
             prev_speaker = None
         else:
             # Continuation of same speaker
-            sections.append(text)
+            chunk = sep + text
+        write(chunk)
+        written += len(chunk)
 
-    return "\n\n".join(sections)
+    return written
 
 
 def _normalize_caps(text: str) -> str:
@@ -858,7 +1419,9 @@ def _normalize_caps(text: str) -> str:
 
     Preserves common abbreviations and proper nouns.
     """
-    upper_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
+    # Count A-Z with C-level bytes ops instead of a per-char Python loop
+    n_upper = len(text.encode("ascii", "ignore").translate(None, _NON_UPPER_BYTES))
+    upper_ratio = n_upper / max(len(text), 1)
     if upper_ratio < 0.6:
         return text
 
@@ -870,10 +1433,13 @@ def _normalize_caps(text: str) -> str:
             result.append(segment)
             continue
 
+        # Per-word loop measured faster than a whole-segment lower() behind a
+        # regex or translate() abbreviation prefilter on caption-sized segments
         words = segment.split()
         processed = []
         for j, word in enumerate(words):
-            upper_word = word.upper().rstrip(".,;:!?'\"")
+            # Caption words are nearly always already upper — skip the copy
+            upper_word = (word if word.isupper() else word.upper()).rstrip(_WORD_STRIP_CHARS)
             if upper_word in _PRESERVE_ABBREVS:
                 processed.append(word)
             elif j == 0:
@@ -13,14 +13,20 @@ Twice-weekly pipeline that:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import html as html_mod
 import json
 import logging
 import os
 import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 
 from dotenv import load_dotenv
 import httpx
@@ -36,8 +42,30 @@ from state import State
 
 log = logging.getLogger(__name__)
 
+# ijson is optional: with it, index.json is streamed entry by entry and only
+# recent hearings become Python objects, instead of loading the whole index
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional too; it parses LLM responses and serializes the compose
+# prompt's quote set several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 MAX_QUOTES = 30
 
+# Concurrent quote-extraction calls; chunks from every transcript in a run
+# share one pool and one pooled OpenRouter connection
+_EXTRACT_WORKERS = 8
+
+# Pre-compiled patterns for inline markdown
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
 
 @dataclass
 class Quote:
@@ -54,11 +82,83 @@ class Quote:
     themes: list[str] = field(default_factory=list)
 
 
+def _call_llm(
+    prompt: str,
+    model: str,
+    api_key: str,
+    timeout: float = 120.0,
+    client: httpx.Client | None = None,
+    cache: State | None = None,
+) -> dict:
+    """call_openrouter, optionally through the state DB's response cache.
+
+    Keyed on model + prompt, so re-running the digest over the same
+    transcripts (dry runs, retries after a failed send) makes no API calls.
+    Entries expire after config.DIGEST_LLM_CACHE_TTL_HOURS, and only complete,
+    non-empty completions are stored.  Cache hits come back with empty usage:
+    they cost nothing this run.  A state DB error (e.g. "database is locked"
+    under the extraction threads) is logged and treated as a cache miss.
+    """
+    if cache is None:
+        return call_openrouter(prompt, model, api_key, timeout=timeout, client=client)
+
+    cache_key = _llm_cache_key(model, prompt)
+    try:
+        cached = cache.get_llm_response(
+            cache_key, max_age=timedelta(hours=config.DIGEST_LLM_CACHE_TTL_HOURS))
+    except sqlite3.Error as e:
+        log.warning("LLM cache read failed, calling the API: %s", e)
+        cached = None
+    if cached is not None:
+        return {**cached, "usage": {}}
+
+    response = call_openrouter(prompt, model, api_key, timeout=timeout, client=client)
+    if _is_cacheable(response):
+        try:
+            cache.record_llm_response(cache_key, model, response)
+        except sqlite3.Error as e:
+            log.warning("LLM cache write failed: %s", e)
+    return response
+
+
+def _llm_cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+
+
+def _is_cacheable(response: dict) -> bool:
+    """True for a finished completion with non-empty text and no error."""
+    if response.get("error"):
+        return False
+    try:
+        choice = response["choices"][0]
+        content = choice["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return False
+    # "length", "content_filter" and "error" mark truncated or degraded output
+    if choice.get("finish_reason") not in (None, "stop"):
+        return False
+    return isinstance(content, str) and bool(content.strip())
+
+
 # ---------------------------------------------------------------------------
 # Step 1: Find recent transcripts
 # ---------------------------------------------------------------------------
 
 
+def _iter_index_entries(index_path: Path) -> Iterator[dict]:
+    """Yield the "hearings" entries of index.json."""
+    if ijson is not None:
+        with open(index_path, "rb") as f:
+            # Entries aren't date-sorted, so every one is still visited
+            yield from ijson.items(f, "hearings.item", use_float=True)
+        return
+    if orjson is not None:
+        yield from orjson.loads(index_path.read_bytes()).get("hearings", [])
+        return
+    with open(index_path, encoding="utf-8") as f:
+        yield from json.load(f).get("hearings", [])
+
+
 def find_recent_transcripts(lookback_days: int) -> list[dict]:
     """Read index.json and return transcripts from the last N days."""
     index_path = config.TRANSCRIPTS_DIR / "index.json"
@@ -66,14 +166,11 @@ def find_recent_transcripts(lookback_days: int) -> list[dict]:
         log.error("index.json not found at %s", index_path)
         return []
 
-    with open(index_path, encoding="utf-8") as f:
-        data = json.load(f)
-
     cutoff = (date.today() - timedelta(days=lookback_days)).isoformat()
     recent = []
     seen_ids: set[str] = set()
 
-    for entry in data.get("hearings", []):
+    for entry in _iter_index_entries(index_path):
         if entry.get("date", "") < cutoff:
             continue
 
@@ -138,84 +235,169 @@ Transcript chunk:
 {text}"""
 
 
-def extract_quotes_from_transcript(
-    hearing: dict, api_key: str
-) -> tuple[list[Quote], float]:
-    """Extract quotes from a single transcript. Returns (quotes, cost_usd)."""
-    transcript_path = hearing["transcript_path"]
-    with open(transcript_path, encoding="utf-8") as f:
+def _load_chunks(hearing: dict) -> list[str]:
+    """Read a transcript and split it into extraction-sized chunks."""
+    with open(hearing["transcript_path"], encoding="utf-8") as f:
         text = f.read()
 
     if not text.strip():
-        return [], 0.0
+        return []
 
-    source_url = _get_source_url(hearing["meta"])
     chunks = split_into_chunks(text, chunk_size=4000, overlap=200)
     log.info(
         "Extracting quotes from '%s' (%d chunks)",
         hearing["title"][:60],
         len(chunks),
     )
+    return chunks
 
-    all_quotes: list[Quote] = []
-    total_cost = 0.0
 
-    for i, chunk in enumerate(chunks):
-        prompt = EXTRACT_PROMPT.format(text=chunk)
-        try:
-            response = call_openrouter(prompt, config.DIGEST_MODEL, api_key)
+def _extract_chunk_quotes(
+    hearing: dict,
+    i: int,
+    chunk: str,
+    api_key: str,
+    client: httpx.Client | None = None,
+    cache: State | None = None,
+) -> tuple[list[Quote], float]:
+    """Extract quotes from one transcript chunk. Returns (quotes, cost_usd)."""
+    prompt = EXTRACT_PROMPT.format(text=chunk)
+    try:
+        response = _call_llm(
+            prompt, config.DIGEST_MODEL, api_key, client=client, cache=cache,
+        )
 
-            usage = response.get("usage", {})
-            cost = calculate_cost(
-                config.DIGEST_MODEL,
-                usage.get("prompt_tokens", 0),
-                usage.get("completion_tokens", 0),
-            )
-            total_cost += cost
+        usage = response.get("usage", {})
+        cost = calculate_cost(
+            config.DIGEST_MODEL,
+            usage.get("prompt_tokens", 0),
+            usage.get("completion_tokens", 0),
+        )
 
-            raw = response["choices"][0]["message"]["content"]
-        except (httpx.HTTPError, KeyError, IndexError) as e:
-            log.warning(
-                "Quote extraction failed for chunk %d of %s: %s", i, hearing["id"], e
-            )
-            continue
+        raw = response["choices"][0]["message"]["content"]
+    except (httpx.HTTPError, KeyError, IndexError) as e:
+        log.warning(
+            "Quote extraction failed for chunk %d of %s: %s", i, hearing["id"], e
+        )
+        return [], 0.0
 
-        # Strip markdown code fences if present
-        raw = re.sub(r"^```(?:json)?\s*", "", raw.strip())
-        raw = re.sub(r"\s*```$", "", raw.strip())
+    # Strip markdown code fences if present
+    raw = raw.strip()
+    if raw.startswith("```"):
+        raw = raw[3:].removeprefix("json").lstrip()
+    if raw.endswith("```"):
+        raw = raw[:-3].rstrip()
 
-        try:
-            items = json.loads(raw)
-        except json.JSONDecodeError:
-            log.warning("Failed to parse quote JSON for %s", hearing["id"])
-            continue
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        items = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError:
+        log.warning("Failed to parse quote JSON for %s", hearing["id"])
+        _evict_cached(cache, prompt)
+        return [], cost
+
+    if not isinstance(items, list):
+        log.warning("LLM returned non-list items for %s (type=%s), skipping chunk", hearing["id"], type(items).__name__)
+        _evict_cached(cache, prompt)
+        return [], cost
 
-        if not isinstance(items, list):
-            log.warning("LLM returned non-list items for %s (type=%s), skipping chunk", hearing["id"], type(items).__name__)
+    source_url = _get_source_url(hearing["meta"])
+    quotes = []
+    for item in items:
+        if not isinstance(item, dict) or not item.get("quote"):
             continue
+        quotes.append(Quote(
+            text=item["quote"],
+            speaker=item.get("speaker", "Unknown"),
+            context=item.get("context", ""),
+            hearing_title=hearing["title"],
+            committee=hearing["committee"],
+            hearing_date=hearing["date"],
+            source_url=source_url,
+        ))
+    return quotes, cost
+
+
+def _evict_cached(cache: State | None, prompt: str) -> None:
+    """Forget an unusable extraction response so the next run asks again."""
+    if cache is None:
+        return
+    try:
+        cache.delete_llm_response(_llm_cache_key(config.DIGEST_MODEL, prompt))
+    except sqlite3.Error as e:
+        log.warning("LLM cache eviction failed: %s", e)
 
-        for item in items:
-            if not isinstance(item, dict) or not item.get("quote"):
-                continue
-            all_quotes.append(Quote(
-                text=item["quote"],
-                speaker=item.get("speaker", "Unknown"),
-                context=item.get("context", ""),
-                hearing_title=hearing["title"],
-                committee=hearing["committee"],
-                hearing_date=hearing["date"],
-                source_url=source_url,
-            ))
 
-    log.info(
-        "Extracted %d quotes from '%s' ($%.4f)",
-        len(all_quotes),
-        hearing["title"][:60],
-        total_cost,
-    )
+def extract_quotes_from_transcripts(
+    transcripts: list[dict],
+    api_key: str,
+    workers: int = _EXTRACT_WORKERS,
+    client: httpx.Client | None = None,
+    cache: State | None = None,
+) -> tuple[list[Quote], float]:
+    """Extract quotes from several transcripts concurrently.
+
+    Transcript files are read, then every chunk of every transcript becomes
+    one OpenRouter call; both steps are I/O-bound, so they run on one thread
+    pool, with the calls sharing one httpx.Client (the given client, or one
+    opened for this call).
+
+    Returns:
+        (quotes, cost_usd), with quotes in transcript then chunk order.
+    """
+    if client is None:
+        with httpx.Client(timeout=120.0) as own_client:
+            return extract_quotes_from_transcripts(
+                transcripts, api_key, workers=workers, client=own_client, cache=cache,
+            )
+
+    if not transcripts:
+        return [], 0.0
+
+    def _extract(job: tuple[dict, int, str]) -> tuple[list[Quote], float]:
+        hearing, i, chunk = job
+        return _extract_chunk_quotes(hearing, i, chunk, api_key, client, cache)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chunked = list(zip(transcripts, pool.map(_load_chunks, transcripts)))
+        jobs = [
+            (hearing, i, chunk)
+            for hearing, chunks in chunked
+            for i, chunk in enumerate(chunks)
+        ]
+        if not jobs:
+            return [], 0.0
+        results = list(pool.map(_extract, jobs))
+
+    all_quotes: list[Quote] = []
+    total_cost = 0.0
+    chunk_results = iter(results)
+    for hearing, chunks in chunked:
+        if not chunks:
+            continue
+        hearing_quotes: list[Quote] = []
+        hearing_cost = 0.0
+        for quotes, cost in islice(chunk_results, len(chunks)):
+            hearing_quotes.extend(quotes)
+            hearing_cost += cost
+        log.info(
+            "Extracted %d quotes from '%s' ($%.4f)",
+            len(hearing_quotes),
+            hearing["title"][:60],
+            hearing_cost,
+        )
+        all_quotes.extend(hearing_quotes)
+        total_cost += hearing_cost
     return all_quotes, total_cost
 
 
+def extract_quotes_from_transcript(
+    hearing: dict, api_key: str
+) -> tuple[list[Quote], float]:
+    """Extract quotes from a single transcript. Returns (quotes, cost_usd)."""
+    return extract_quotes_from_transcripts([hearing], api_key)
+
+
 # ---------------------------------------------------------------------------
 # Step 3: Score against interest model
 # ---------------------------------------------------------------------------
@@ -269,7 +451,12 @@ Quotes:
 {quotes_json}"""
 
 
-def compose_digest(quotes: list[Quote], api_key: str) -> tuple[str, float]:
+def compose_digest(
+    quotes: list[Quote],
+    api_key: str,
+    client: httpx.Client | None = None,
+    cache: State | None = None,
+) -> tuple[str, float]:
     """Compose markdown digest from scored quotes. Returns (markdown, cost)."""
     # Group by top theme
     grouped: dict[str, list[dict]] = {}
@@ -286,10 +473,18 @@ def compose_digest(quotes: list[Quote], api_key: str) -> tuple[str, float]:
         }
         grouped.setdefault(theme, []).append(entry)
 
-    prompt = COMPOSE_PROMPT.format(quotes_json=json.dumps(grouped, indent=2))
+    # Both encoders produce the same text, so cached responses stay valid
+    # whether or not orjson is installed
+    if orjson is not None:
+        quotes_json = orjson.dumps(grouped, option=orjson.OPT_INDENT_2).decode()
+    else:
+        quotes_json = json.dumps(grouped, indent=2, ensure_ascii=False)
+    prompt = COMPOSE_PROMPT.format(quotes_json=quotes_json)
 
     try:
-        response = call_openrouter(prompt, config.DIGEST_MODEL, api_key, timeout=180.0)
+        response = _call_llm(
+            prompt, config.DIGEST_MODEL, api_key, timeout=180.0, client=client, cache=cache,
+        )
         usage = response.get("usage", {})
         cost = calculate_cost(
             config.DIGEST_MODEL,
@@ -321,13 +516,21 @@ Return the polished markdown:
 {body}"""
 
 
-def polish_digest(body: str, api_key: str) -> tuple[str, float]:
+def polish_digest(
+    body: str,
+    api_key: str,
+    client: httpx.Client | None = None,
+    cache: State | None = None,
+) -> tuple[str, float]:
     """Polish the digest with Claude Haiku. Returns (polished, cost)."""
     prompt = POLISH_PROMPT.format(body=body)
 
     cost = 0.0
     try:
-        response = call_openrouter(prompt, config.DIGEST_POLISH_MODEL, api_key, timeout=120.0)
+        response = _call_llm(
+            prompt, config.DIGEST_POLISH_MODEL, api_key, timeout=120.0, client=client,
+            cache=cache,
+        )
         usage = response.get("usage", {})
         cost = calculate_cost(
             config.DIGEST_POLISH_MODEL,
@@ -350,11 +553,13 @@ def polish_digest(body: str, api_key: str) -> tuple[str, float]:
 # ---------------------------------------------------------------------------
 
 
+# Pure function of the line; attribution and source-link lines repeat
+# throughout a digest
+@functools.lru_cache(maxsize=4096)
 def _inline_format(text: str) -> str:
     """Apply inline markdown formatting: bold and links."""
     # Bold
-    text = re.sub(
-        r"\*\*(.+?)\*\*",
+    text = _BOLD_RE.sub(
         lambda m: f'<strong style="color: #222;">{html_mod.escape(m.group(1))}</strong>',
         text,
     )
@@ -370,7 +575,7 @@ def _inline_format(text: str) -> str:
             f'text-decoration-color: #93b4f5;">{link_text}</a>'
         )
 
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", _replace_link, text)
+    text = _LINK_RE.sub(_replace_link, text)
     return text
 
 
@@ -387,9 +592,10 @@ def _markdown_to_simple_html(md: str) -> str:
 
     for line in lines:
         stripped = line.strip()
+        lead = stripped[:1]
 
         # Blockquote
-        if stripped.startswith("> "):
+        if lead == ">" and stripped.startswith("> "):
             if in_list:
                 html_lines.append("</ul>")
                 in_list = False
@@ -408,60 +614,47 @@ def _markdown_to_simple_html(md: str) -> str:
             html_lines.append("</blockquote>")
             in_blockquote = False
 
+        # Anything other than another bullet ends an open list
+        is_item = lead == "-" and stripped.startswith("- ")
+        if in_list and not is_item:
+            html_lines.append("</ul>")
+            in_list = False
+
+        if is_item:
+            if not in_list:
+                html_lines.append('<ul style="padding-left: 18px; margin: 8px 0;">')
+                in_list = True
+            html_lines.append(
+                f'<li style="margin-bottom: 5px; font-size: 16px; line-height: 1.7;">'
+                f"{fmt(stripped[2:])}</li>"
+            )
         # Headers
-        if stripped.startswith("### "):
-            if in_list:
-                html_lines.append("</ul>")
-                in_list = False
+        elif lead == "#" and stripped.startswith("### "):
             html_lines.append(
                 f'<h3 style="margin: 20px 0 6px; font-size: 16px; font-weight: 600; color: #444;">'
                 f"{fmt(stripped[4:])}</h3>"
             )
-        elif stripped.startswith("## "):
-            if in_list:
-                html_lines.append("</ul>")
-                in_list = False
+        elif lead == "#" and stripped.startswith("## "):
             html_lines.append(
                 f'<h2 style="margin: 32px 0 10px; font-size: 18px; font-weight: 600; color: #333; '
                 f'border-bottom: 1px solid #e5e5e5; padding-bottom: 6px;">'
                 f"{fmt(stripped[3:])}</h2>"
             )
-        elif stripped.startswith("# "):
-            if in_list:
-                html_lines.append("</ul>")
-                in_list = False
+        elif lead == "#" and stripped.startswith("# "):
             html_lines.append(
                 f'<h1 style="margin: 0 0 20px; font-size: 28px; font-weight: normal; line-height: 1.3; '
                 f'color: #111;">'
                 f"{fmt(stripped[2:])}</h1>"
             )
-        elif stripped.startswith("- "):
-            if not in_list:
-                html_lines.append('<ul style="padding-left: 18px; margin: 8px 0;">')
-                in_list = True
-            html_lines.append(
-                f'<li style="margin-bottom: 5px; font-size: 16px; line-height: 1.7;">'
-                f"{fmt(stripped[2:])}</li>"
-            )
         elif stripped == "---":
-            if in_list:
-                html_lines.append("</ul>")
-                in_list = False
             html_lines.append(
                 '<hr style="border: none; border-top: 1px dashed #ddd; margin: 28px 0;">'
             )
         elif stripped:
-            if in_list:
-                html_lines.append("</ul>")
-                in_list = False
             html_lines.append(
                 f'<p style="margin: 10px 0; font-size: 16px; line-height: 1.75;">'
                 f"{fmt(stripped)}</p>"
             )
-        else:
-            if in_list:
-                html_lines.append("</ul>")
-                in_list = False
 
     if in_list:
         html_lines.append("</ul>")
@@ -563,8 +756,13 @@ def _run_digest_pipeline(
     end_date: str,
     state: State | None = None,
     record_digest_run: bool = False,
+    use_cache: bool = True,
 ) -> dict:
-    """Run extraction->scoring->compose->deliver for an explicit transcript list."""
+    """Run extraction->scoring->compose->deliver for an explicit transcript list.
+
+    With use_cache and a state, LLM responses are cached in its DB, so
+    re-running over the same transcripts skips the API calls already made.
+    """
     if not transcripts:
         return {
             "sent": False,
@@ -576,50 +774,63 @@ def _run_digest_pipeline(
 
     api_key = get_api_key()
     total_cost = 0.0
+    cache = state if use_cache else None
+    if cache is not None:
+        try:
+            pruned = cache.prune_llm_responses(
+                timedelta(hours=config.DIGEST_LLM_CACHE_TTL_HOURS))
+        except sqlite3.Error as e:
+            log.warning("Pruning cached LLM responses failed: %s", e)
+            pruned = 0
+        if pruned:
+            log.info("Pruned %d expired cached LLM responses", pruned)
 
-    # Step 2: Extract quotes
-    all_quotes: list[Quote] = []
-    for t in transcripts:
-        quotes, cost = extract_quotes_from_transcript(t, api_key)
-        all_quotes.extend(quotes)
-        total_cost += cost
+    # One pooled OpenRouter connection for every LLM call in the run
+    with httpx.Client(timeout=120.0) as client:
+        # Step 2: Extract quotes (all chunks of all transcripts in parallel)
+        all_quotes, extract_cost = extract_quotes_from_transcripts(
+            transcripts, api_key, client=client, cache=cache,
+        )
+        total_cost += extract_cost
 
-    if not all_quotes:
-        log.info("No quotes extracted, nothing to digest")
-        return {
-            "sent": False,
-            "hearings_scanned": len(transcripts),
-            "quotes_extracted": 0,
-            "quotes_selected": 0,
-            "cost_usd": total_cost,
-        }
+        if not all_quotes:
+            log.info("No quotes extracted, nothing to digest")
+            return {
+                "sent": False,
+                "hearings_scanned": len(transcripts),
+                "quotes_extracted": 0,
+                "quotes_selected": 0,
+                "cost_usd": total_cost,
+            }
 
-    log.info("Total quotes extracted: %d", len(all_quotes))
+        log.info("Total quotes extracted: %d", len(all_quotes))
 
-    # Step 3: Score against interest model
-    scored_quotes, score_cost = score_quotes(all_quotes)
-    total_cost += score_cost
+        # Step 3: Score against interest model
+        scored_quotes, score_cost = score_quotes(all_quotes)
+        total_cost += score_cost
 
-    if not scored_quotes:
-        log.info("No quotes above threshold (%.2f)", config.DIGEST_SCORE_THRESHOLD)
-        return {
-            "sent": False,
-            "hearings_scanned": len(transcripts),
-            "quotes_extracted": len(all_quotes),
-            "quotes_selected": 0,
-            "cost_usd": total_cost,
-        }
+        if not scored_quotes:
+            log.info("No quotes above threshold (%.2f)", config.DIGEST_SCORE_THRESHOLD)
+            return {
+                "sent": False,
+                "hearings_scanned": len(transcripts),
+                "quotes_extracted": len(all_quotes),
+                "quotes_selected": 0,
+                "cost_usd": total_cost,
+            }
 
-    # Step 4: Compose digest
-    body, compose_cost = compose_digest(scored_quotes, api_key)
-    total_cost += compose_cost
+        # Step 4: Compose digest
+        body, compose_cost = compose_digest(
+            scored_quotes, api_key, client=client, cache=cache,
+        )
+        total_cost += compose_cost
 
-    if not body:
-        raise ValueError("Failed to compose digest body")
+        if not body:
+            raise ValueError("Failed to compose digest body")
 
-    # Step 5: Polish
-    polished, polish_cost = polish_digest(body, api_key)
-    total_cost += polish_cost
+        # Step 5: Polish
+        polished, polish_cost = polish_digest(body, api_key, client=client, cache=cache)
+        total_cost += polish_cost
 
     # Step 6: Deliver
     sent = deliver_digest(polished, start_date, end_date, dry_run=dry_run)
@@ -650,7 +861,7 @@ def _run_digest_pipeline(
     }
 
 
-def run_digest(dry_run: bool = False) -> None:
+def run_digest(dry_run: bool = False, use_cache: bool = True) -> None:
     """Run the legacy digest path from transcripts/index.json."""
     today = date.today().isoformat()
 
@@ -673,6 +884,7 @@ def run_digest(dry_run: bool = False) -> None:
         end_date=today,
         state=state,
         record_digest_run=True,
+        use_cache=use_cache,
     )
 
 
@@ -717,6 +929,7 @@ def consume_outbox_events(
     max_events: int = 20,
     lease_seconds: int = 900,
     worker_id: str | None = None,
+    use_cache: bool = True,
 ) -> None:
     """Consume transcript-published outbox events and run digest pipeline."""
     if not config.OUTBOX_DIGEST_ENABLED:
@@ -755,6 +968,7 @@ def consume_outbox_events(
             end_date=end_date,
             state=state,
             record_digest_run=True,
+            use_cache=use_cache,
         )
         for event_id in event_ids:
             state.complete_outbox_event(event_id)
@@ -776,6 +990,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Extract, score, and compose but print to stdout instead of emailing",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Call the LLM for every step instead of reusing cached responses",
+    )
     parser.add_argument(
         "--consume-outbox",
         action="store_true",
@@ -807,6 +1026,7 @@ if __name__ == "__main__":
             max_events=args.max_events,
             lease_seconds=args.lease_seconds,
             worker_id=args.worker_id,
+            use_cache=not args.no_cache,
         )
     else:
-        run_digest(dry_run=args.dry_run)
+        run_digest(dry_run=args.dry_run, use_cache=not args.no_cache)
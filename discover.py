@@ -20,7 +20,7 @@ import httpx
 
 import config
 import scrapers
-from detail_scraper import scrape_hearing_detail
+from detail_scraper import scrape_hearing_details
 from utils import (
     TITLE_CLEAN_RE, TITLE_STOPWORDS, USER_AGENT,
     RateLimiter, YT_DLP_ENV, normalize_title, title_similarity,
@@ -1194,8 +1194,8 @@ def discover_all(days: int = 1, committees: dict[str, dict] | None = None,
     # so iframe-extracted params from the detail scraper can override)
     _attach_isvp_params(deduped, committees)
 
-    # After dedup, enrich with testimony PDFs (parallel — rate limiter
-    # in detail_scraper serializes per-domain requests)
+    # After dedup, enrich with testimony PDFs (parallel, interleaved across
+    # hosts — the rate limiter in detail_scraper serializes per-domain requests)
     scrape_targets = []
     for hearing in deduped:
         website_url = hearing.sources.get("website_url")
@@ -1208,27 +1208,19 @@ def discover_all(days: int = 1, committees: dict[str, dict] | None = None,
             continue
         scrape_targets.append((hearing, meta))
 
-    def _scrape_detail(target: tuple[Hearing, dict]) -> None:
-        hearing, meta = target
-        website_url = hearing.sources["website_url"]
-        try:
-            detail = scrape_hearing_detail(
-                hearing.committee_key, website_url, meta,
-            )
-            if detail.pdf_urls:
-                hearing.sources["testimony_pdf_urls"] = detail.pdf_urls
-            if detail.isvp_comm:
-                hearing.sources["isvp_comm"] = detail.isvp_comm
-                hearing.sources["isvp_filename"] = detail.isvp_filename
-            if detail.youtube_url and not hearing.sources.get("youtube_url"):
-                hearing.sources["youtube_url"] = detail.youtube_url
-                hearing.sources["youtube_id"] = detail.youtube_id
-        except (httpx.HTTPError, OSError, ValueError) as e:
-            log.warning("PDF extraction failed for %s: %s", website_url, e)
-
-    if scrape_targets:
-        with ThreadPoolExecutor(max_workers=4) as pool:
-            list(pool.map(_scrape_detail, scrape_targets))
+    details = scrape_hearing_details([
+        (hearing.committee_key, hearing.sources["website_url"], meta)
+        for hearing, meta in scrape_targets
+    ])
+    for (hearing, _meta), detail in zip(scrape_targets, details):
+        if detail.pdf_urls:
+            hearing.sources["testimony_pdf_urls"] = detail.pdf_urls
+        if detail.isvp_comm:
+            hearing.sources["isvp_comm"] = detail.isvp_comm
+            hearing.sources["isvp_filename"] = detail.isvp_filename
+        if detail.youtube_url and not hearing.sources.get("youtube_url"):
+            hearing.sources["youtube_url"] = detail.youtube_url
+            hearing.sources["youtube_id"] = detail.youtube_id
 
     return deduped
 
@@ -137,7 +137,8 @@ def call_openrouter(
         prompt: Prompt to send
         model: Model identifier
         api_key: OpenRouter API key
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (applied per request, so it also
+            holds when a shared client is passed)
         client: Optional shared httpx.Client (caller manages lifecycle)
 
     Returns:
@@ -163,7 +164,9 @@ def call_openrouter(
     }
 
     if client is not None:
-        response = client.post(OPENROUTER_API_URL, json=payload, headers=headers)
+        response = client.post(
+            OPENROUTER_API_URL, json=payload, headers=headers, timeout=timeout,
+        )
         response.raise_for_status()
         return response.json()
 
@@ -131,6 +131,14 @@ class State:
             )
         """)
 
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cspan_waf_blocks (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                blocked_at TEXT,
+                blocked_until TEXT
+            )
+        """)
+
         conn.execute("""
             CREATE TABLE IF NOT EXISTS digest_runs (
                 run_date TEXT PRIMARY KEY,
@@ -141,6 +149,15 @@ class State:
             )
         """)
 
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT,
+                response_json TEXT,
+                created_at TEXT
+            )
+        """)
+
         # Queue rollout scaffolding (north-star phases 1+)
         conn.execute("""
             CREATE TABLE IF NOT EXISTS queue_run_audits (
@@ -1720,6 +1737,20 @@ class State:
         now = datetime.now(timezone.utc)
         return (now - last).days
 
+    def get_all_cspan_search_ages(self) -> dict[str, int]:
+        """Days since last C-SPAN search, for every committee ever searched."""
+        conn = self._get_conn()
+        cursor = conn.execute(
+            "SELECT committee_key, last_searched FROM cspan_searches"
+            " WHERE last_searched IS NOT NULL"
+        )
+        now = datetime.now(timezone.utc)
+        return {
+            row["committee_key"]:
+                (now - _ensure_utc(datetime.fromisoformat(row["last_searched"]))).days
+            for row in cursor.fetchall()
+        }
+
     def record_cspan_search(self, committee_key: str, result_count: int) -> None:
         """Record that a C-SPAN search was done for this committee."""
         conn = self._get_conn()
@@ -1768,17 +1799,66 @@ class State:
         )
         return cursor.fetchone() is not None
 
+    def get_cspan_searched_ids(self, hearing_ids: list[str]) -> set[str]:
+        """Return which of hearing_ids have already had a title search."""
+        conn = self._get_conn()
+        searched: set[str] = set()
+        # Chunked to stay under SQLite's bound-parameter limit
+        for i in range(0, len(hearing_ids), 500):
+            chunk = hearing_ids[i:i + 500]
+            cursor = conn.execute(
+                "SELECT hearing_id FROM cspan_title_searches"
+                f" WHERE hearing_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            searched.update(row["hearing_id"] for row in cursor.fetchall())
+        return searched
+
     def record_cspan_title_search(self, hearing_id: str, found: bool) -> None:
         """Record that a C-SPAN title search was done for this hearing."""
+        self.record_cspan_title_searches([(hearing_id, found)])
+
+    def record_cspan_title_searches(self, results: list[tuple[str, bool]]) -> None:
+        """Record (hearing_id, found) title-search outcomes in one transaction."""
+        if not results:
+            return
         conn = self._get_conn()
         now = datetime.now(timezone.utc).isoformat()
-        conn.execute("""
+        conn.executemany("""
             INSERT INTO cspan_title_searches (hearing_id, searched_at, found)
             VALUES (?, ?, ?)
             ON CONFLICT(hearing_id) DO UPDATE
             SET searched_at = excluded.searched_at,
                 found = excluded.found
-        """, (hearing_id, now, 1 if found else 0))
+        """, [(hearing_id, now, 1 if found else 0) for hearing_id, found in results])
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # C-SPAN WAF block tracking (skip doomed searches on back-to-back runs)
+    # ------------------------------------------------------------------
+
+    def get_cspan_waf_blocked_until(self) -> datetime | None:
+        """Return when the last recorded C-SPAN WAF block expires, or None."""
+        conn = self._get_conn()
+        cursor = conn.execute(
+            "SELECT blocked_until FROM cspan_waf_blocks WHERE id = 1"
+        )
+        row = cursor.fetchone()
+        if row is None or row["blocked_until"] is None:
+            return None
+        return _ensure_utc(datetime.fromisoformat(row["blocked_until"]))
+
+    def record_cspan_waf_block(self, blocked_until: datetime) -> None:
+        """Record that C-SPAN's WAF blocked us until blocked_until."""
+        conn = self._get_conn()
+        now = datetime.now(timezone.utc).isoformat()
+        conn.execute("""
+            INSERT INTO cspan_waf_blocks (id, blocked_at, blocked_until)
+            VALUES (1, ?, ?)
+            ON CONFLICT(id) DO UPDATE
+            SET blocked_at = excluded.blocked_at,
+                blocked_until = excluded.blocked_until
+        """, (now, _ensure_utc(blocked_until).isoformat()))
         conn.commit()
 
     # ------------------------------------------------------------------
@@ -1840,6 +1920,47 @@ class State:
         row = cursor.fetchone()
         return row["latest"] if row and row["latest"] else None
 
+    def get_llm_response(
+        self, cache_key: str, max_age: timedelta | None = None,
+    ) -> dict | None:
+        """Return a cached LLM API response, or None on a miss.
+
+        Entries older than max_age count as misses.
+        """
+        conn = self._get_conn()
+        cutoff = "" if max_age is None else (datetime.now(timezone.utc) - max_age).isoformat()
+        cursor = conn.execute(
+            "SELECT response_json FROM llm_responses WHERE cache_key = ? AND created_at >= ?",
+            (cache_key, cutoff),
+        )
+        row = cursor.fetchone()
+        return json.loads(row["response_json"]) if row else None
+
+    def record_llm_response(self, cache_key: str, model: str, response: dict) -> None:
+        """Cache an LLM API response under cache_key."""
+        conn = self._get_conn()
+        now = datetime.now(timezone.utc).isoformat()
+        conn.execute("""
+            INSERT OR REPLACE INTO llm_responses
+                (cache_key, model, response_json, created_at)
+            VALUES (?, ?, ?, ?)
+        """, (cache_key, model, json.dumps(response), now))
+        conn.commit()
+
+    def delete_llm_response(self, cache_key: str) -> None:
+        """Drop one cached LLM API response."""
+        conn = self._get_conn()
+        conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+        conn.commit()
+
+    def prune_llm_responses(self, max_age: timedelta) -> int:
+        """Delete cached LLM API responses older than max_age. Returns rows removed."""
+        conn = self._get_conn()
+        cutoff = (datetime.now(timezone.utc) - max_age).isoformat()
+        cursor = conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (cutoff,))
+        conn.commit()
+        return cursor.rowcount
+
     def get_last_rotation_time(self) -> datetime | None:
         """Return the most recent C-SPAN committee rotation search time, or None."""
         conn = self._get_conn()
@@ -1,6 +1,32 @@
 """Tests for cspan.py — keyword extraction, caps normalization, transcript building."""
 
-from cspan import _extract_search_keywords, _normalize_caps, _build_transcript
+import io
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+import cspan
+from cspan import (
+    _DISCOVERY_BLOCKED_RESOURCES,
+    _TRANSCRIPT_BLOCKED_RESOURCES,
+    _block_resources,
+    _build_transcript,
+    _extract_search_keywords,
+    _is_waf_challenge,
+    _normalize_caps,
+    _parse_result_date,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cookie_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.CSPAN_COOKIES_JSON", tmp_path / "cspan_cookies.json")
+    monkeypatch.setattr("cspan._waf_cookies", None)
 
 
 class TestExtractSearchKeywords:
@@ -22,6 +48,13 @@ class TestExtractSearchKeywords:
         assert "defense" in result.split()
         assert "officials" in result.split()
 
+    def test_repeated_titles_hit_cache(self):
+        title = "Nominations for Department of Defense Officials"
+        first = _extract_search_keywords(title)
+        hits = _extract_search_keywords.cache_info().hits
+        assert _extract_search_keywords(title) == first
+        assert _extract_search_keywords.cache_info().hits == hits + 1
+
     def test_max_words_default(self):
         title = ("Examining Artificial Intelligence Applications in Healthcare "
                  "and National Security Infrastructure and Economic Growth")
@@ -101,6 +134,10 @@ class TestNormalizeCaps:
         assert "First" in result
         assert "Second" in result
 
+    def test_abbreviations_with_trailing_punctuation(self):
+        text = "FBI, CIA AND THE FED! WHAT ABOUT GDP?"
+        assert _normalize_caps(text) == "FBI, CIA and the FED! What about GDP?"
+
     def test_preserves_covid_abbreviation(self):
         text = "THE COVID PANDEMIC CHANGED EVERYTHING"
         result = _normalize_caps(text)
@@ -112,6 +149,29 @@ class TestNormalizeCaps:
 
 
 class TestBuildTranscript:
+    def test_write_returns_chars_written(self):
+        parts = [
+            {"cc_name": "", "text": "OPENING."},
+            {"cc_name": "Sen. Smith", "text": "THANK YOU."},
+        ]
+        out = io.StringIO()
+        n = cspan._write_transcript(parts, out)
+        assert out.getvalue() == "Opening.\n\n\nSen. Smith:\nThank you."
+        assert n == len(out.getvalue())
+
+    @patch("cspan._rate_limit", lambda *a: None)
+    def test_fetch_leaves_no_file_for_empty_transcript(self, tmp_path):
+        cspan._save_waf_cookies([
+            {"name": "aws-waf-token", "value": "tok", "domain": ".c-span.org"}])
+        request = httpx.Request("GET", cspan._TRANSCRIPT_API_URL)
+        resp = httpx.Response(200, json={"parts": [{"text": "  "}]}, request=request)
+        with patch("cspan.httpx.get", return_value=resp):
+            path = cspan.fetch_cspan_transcript(
+                "https://www.c-span.org/program/senate-committee/hearing/672588",
+                tmp_path / "out")
+        assert path is None
+        assert list((tmp_path / "out").iterdir()) == []
+
     def test_speaker_transition(self):
         parts = [
             {"cc_name": "Sen. Smith", "text": "THANK YOU, MR. CHAIRMAN.", "secAppOffset": 0},
@@ -185,3 +245,683 @@ class TestBuildTranscript:
     def test_empty_parts_list(self):
         result = _build_transcript([])
         assert result.strip() == ""
+
+    def test_line_breaks_become_single_spaces(self):
+        parts = [
+            {"cc_name": "Speaker", "text": "Line one\n\nline two\r\nline\tthree   four", "secAppOffset": 0},
+        ]
+        result = _build_transcript(parts)
+        assert result.endswith("Line one line two line three four")
+
+
+class TestIsWafChallenge:
+    def test_returns_evaluate_result(self):
+        page = MagicMock()
+        page.evaluate.return_value = True
+        assert _is_waf_challenge(page) is True
+        page.inner_text.assert_not_called()
+
+    def test_false_when_not_challenged(self):
+        page = MagicMock()
+        page.evaluate.return_value = None
+        assert _is_waf_challenge(page) is False
+
+
+class TestBlockResources:
+    def _route(self, resource_type):
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        return route
+
+    def _handler(self, resource_types):
+        context = MagicMock()
+        _block_resources(context, resource_types)
+        pattern, handler = context.route.call_args.args
+        assert pattern == "**/*"
+        return handler
+
+    def test_aborts_blocked_types(self):
+        handler = self._handler(_DISCOVERY_BLOCKED_RESOURCES)
+        for rtype in ("image", "media", "font", "stylesheet"):
+            route = self._route(rtype)
+            handler(route)
+            route.abort.assert_called_once()
+            route.continue_.assert_not_called()
+
+    def test_continues_documents_and_scripts(self):
+        handler = self._handler(_DISCOVERY_BLOCKED_RESOURCES)
+        for rtype in ("document", "script", "xhr", "fetch"):
+            route = self._route(rtype)
+            handler(route)
+            route.continue_.assert_called_once()
+            route.abort.assert_not_called()
+
+    def test_transcript_page_keeps_stylesheets(self):
+        handler = self._handler(_TRANSCRIPT_BLOCKED_RESOURCES)
+        route = self._route("stylesheet")
+        handler(route)
+        route.continue_.assert_called_once()
+
+
+class TestParseResultDate:
+    def test_first_date_is_event_date(self):
+        text = "FEBRUARY 5, 2026\nLAST AIRED FEBRUARY 7, 2026\nTreasury Secy. Testifies"
+        assert _parse_result_date(text) == datetime(2026, 2, 5, tzinfo=timezone.utc)
+
+    def test_comma_optional(self):
+        assert _parse_result_date("MAY 12 2025") == datetime(2025, 5, 12, tzinfo=timezone.utc)
+
+    def test_comparable_with_aware_cutoff(self):
+        cutoff = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert _parse_result_date("MARCH 3, 2026") > cutoff
+
+    def test_invalid_day(self):
+        assert _parse_result_date("FEBRUARY 30, 2026") is None
+
+    def test_no_date(self):
+        assert _parse_result_date("Treasury Secy. Testifies") is None
+
+
+class TestBrowserPool:
+    def _fake_browser(self):
+        browser = MagicMock()
+        page = browser.new_context.return_value.new_page.return_value
+        page.evaluate.return_value = False  # no WAF captcha
+        return browser
+
+    def test_discovery_reuses_pooled_browser(self, monkeypatch):
+        browser = self._fake_browser()
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+        monkeypatch.setattr("cspan._rate_limit", lambda *a: None)
+        committees = {
+            "house.a": {"cspan_id": "1"},
+            "house.b": {"cspan_id": "2"},
+        }
+
+        cspan.discover_cspan_by_committee(["house.a"], committees)
+        cspan.discover_cspan_by_committee(["house.b"], committees)
+
+        assert browser.new_context.call_count == 2
+        assert browser.new_context.return_value.close.call_count == 2
+        browser.close.assert_not_called()
+
+    def test_transcript_closes_context_not_browser(self, monkeypatch, tmp_path):
+        browser = self._fake_browser()
+        page = browser.new_context.return_value.new_page.return_value
+        page.evaluate.return_value = None  # transcript API unavailable
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+        monkeypatch.setattr("cspan._rate_limit", lambda *a: None)
+
+        result = cspan.fetch_cspan_transcript(
+            "https://www.c-span.org/program/senate-committee/hearing/672588", tmp_path)
+
+        assert result is None
+        browser.new_context.return_value.close.assert_called_once()
+        browser.close.assert_not_called()
+
+    def test_browser_closed_on_the_thread_that_launched_it(self, monkeypatch):
+        pw = MagicMock()
+        browser = pw.chromium.launch.return_value
+        browser.is_connected.return_value = True
+        threads = {}
+        pw.chromium.launch.side_effect = lambda **kw: (
+            threads.setdefault("launch", threading.get_ident()), browser)[1]
+        browser.close.side_effect = lambda: threads.setdefault("close", threading.get_ident())
+        pw.stop.side_effect = lambda: threads.setdefault("stop", threading.get_ident())
+        monkeypatch.setattr("playwright.sync_api.sync_playwright",
+                            lambda: MagicMock(start=lambda: pw))
+
+        worker = cspan._browser_workers(1)[0]
+        assert worker.submit(cspan._get_browser).result() is browser
+        assert worker.submit(cspan._get_browser).result() is browser
+        cspan._shutdown_pool()
+
+        pw.chromium.launch.assert_called_once()
+        browser.close.assert_called_once()
+        pw.stop.assert_called_once()
+        assert threads["close"] == threads["stop"] == threads["launch"]
+        assert threads["launch"] != threading.get_ident()
+        assert cspan._workers == []
+
+    def test_discovery_runs_on_a_browser_worker(self, monkeypatch):
+        browser = self._fake_browser()
+        threads = set()
+        monkeypatch.setattr(
+            "cspan._get_browser", lambda: (threads.add(threading.get_ident()), browser)[1])
+        monkeypatch.setattr("cspan._rate_limit", lambda *a: None)
+
+        cspan.discover_cspan_by_committee(["house.a"], {"house.a": {"cspan_id": "1"}})
+
+        assert len(threads) == 1
+        assert threads <= {w._thread.ident for w in cspan._browser_workers()}
+
+    def test_relaunch_replaces_disconnected_handle(self, monkeypatch):
+        pw, dead = MagicMock(), MagicMock()
+        dead.is_connected.return_value = False
+        monkeypatch.setattr(cspan._pool_local, "playwright", pw, raising=False)
+        monkeypatch.setattr(cspan._pool_local, "browser", dead, raising=False)
+
+        browser = cspan._get_browser()
+
+        assert browser is pw.chromium.launch.return_value
+        assert cspan._pool_local.browser is browser
+        dead.close.assert_called_once()
+        pw.stop.assert_not_called()
+
+    def test_new_context_caps_navigation_timeout(self, monkeypatch):
+        browser = MagicMock()
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+
+        context, _ = cspan._new_cspan_context()
+
+        context.set_default_navigation_timeout.assert_called_once_with(
+            cspan._NAV_TIMEOUT_MS)
+
+
+class TestMaybeRecycleContext:
+    def test_keeps_context_between_boundaries(self, monkeypatch):
+        context, page = MagicMock(), MagicMock()
+        for n in (0, 1, cspan._CONTEXT_MAX_PAGES + 1):
+            assert cspan._maybe_recycle_context(context, page, n) == (context, page)
+        context.close.assert_not_called()
+
+    def test_recycles_with_storage_state(self, monkeypatch):
+        browser = MagicMock()
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+        context, page = MagicMock(), MagicMock()
+        context.storage_state.return_value = {"cookies": [{"name": "aws-waf-token"}]}
+
+        new_context, new_page = cspan._maybe_recycle_context(
+            context, page, cspan._CONTEXT_MAX_PAGES)
+
+        context.close.assert_called_once()
+        assert new_context is browser.new_context.return_value
+        assert browser.new_context.call_args.kwargs["storage_state"] == {
+            "cookies": [{"name": "aws-waf-token"}]}
+
+
+class TestRunSearches:
+    def _patch(self, monkeypatch, results_by_id, waf_ids=()):
+        """Fake pooled browser whose pages 'load' the sponsor ID or query in the URL."""
+        def _make_context(**kwargs):
+            context = MagicMock()
+            page = context.new_page.return_value
+            loaded = {}
+            def _goto(url, **kw):
+                qs = parse_qs(urlparse(url).query)
+                loaded["id"] = (qs.get("sponsorid[]") or qs["query"])[0]
+            page.goto.side_effect = _goto
+            page.evaluate.side_effect = lambda js, *a: (
+                len(results_by_id.get(loaded.get("id"), []))
+                if js is cspan._RESULT_LINK_COUNT_JS
+                else loaded.get("id") in waf_ids)
+            page._loaded = loaded
+            return context
+
+        browser = MagicMock()
+        browser.new_context.side_effect = _make_context
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+        monkeypatch.setattr("cspan._rate_limit", lambda *a: None)
+        monkeypatch.setattr("cspan._time.sleep", lambda s: None)
+        monkeypatch.setattr(
+            "cspan._parse_search_results",
+            lambda page, cutoff: results_by_id.get(page._loaded["id"], []))
+        return browser
+
+    def test_results_merged_in_queue_order(self, monkeypatch):
+        results = {
+            str(i): [{"program_id": str(100 + i), "title": f"t{i}"}] for i in range(5)
+        }
+        browser = self._patch(monkeypatch, results)
+        committees = {f"house.c{i}": {"cspan_id": str(i)} for i in range(5)}
+
+        found = cspan.discover_cspan_by_committee(list(committees), committees)
+
+        assert [h["committee_key"] for h in found] == list(committees)
+        assert browser.new_context.call_count == cspan._SEARCH_WORKERS
+
+    def test_navigation_timeout_skips_only_that_search(self, monkeypatch):
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        results = {str(i): [{"program_id": str(100 + i)}] for i in range(3)}
+        browser = self._patch(monkeypatch, results)
+        make_context = browser.new_context.side_effect
+
+        def _context_timing_out_on_1(**kwargs):
+            context = make_context(**kwargs)
+            page = context.new_page.return_value
+            load = page.goto.side_effect
+            def _goto(url, **kw):
+                load(url, **kw)
+                if page._loaded["id"] == "1":
+                    raise PlaywrightTimeoutError("Timeout 15000ms exceeded")
+            page.goto.side_effect = _goto
+            return context
+        browser.new_context.side_effect = _context_timing_out_on_1
+        queue = [(f"house.c{i}", cspan._sponsor_search_url(str(i))) for i in range(3)]
+
+        outcomes, searches_done, waf_blocked = cspan._run_searches(
+            queue, datetime(2026, 1, 1, tzinfo=timezone.utc), "test")
+
+        assert outcomes == {"house.c0": results["0"], "house.c1": None,
+                            "house.c2": results["2"]}
+        assert searches_done == 3 and not waf_blocked
+
+    def test_waf_block_stops_all_workers(self, monkeypatch):
+        self._patch(monkeypatch, {}, waf_ids={"0"})
+        queue = [(f"house.c{i}", cspan._sponsor_search_url(str(i))) for i in range(6)]
+
+        outcomes, _, waf_blocked = cspan._run_searches(
+            queue, datetime(2026, 1, 1, tzinfo=timezone.utc), "test", workers=1)
+
+        assert outcomes == {}
+        assert waf_blocked
+
+    def test_silent_block_aborts_after_consecutive_empty(self, monkeypatch):
+        self._patch(monkeypatch, {})
+        n = cspan._MAX_CONSECUTIVE_EMPTY + 3
+        queue = [(f"house.c{i}", cspan._sponsor_search_url(str(i))) for i in range(n)]
+
+        outcomes, searches_done, waf_blocked = cspan._run_searches(
+            queue, datetime(2026, 1, 1, tzinfo=timezone.utc), "test",
+            abort_on_empty=True, workers=1)
+
+        assert searches_done == cspan._MAX_CONSECUTIVE_EMPTY
+        assert len(outcomes) == cspan._MAX_CONSECUTIVE_EMPTY
+        assert not waf_blocked
+
+    def test_rotation_queue_never_searched_then_stale(self, monkeypatch, tmp_path):
+        from state import State
+
+        st = State(db_path=tmp_path / "test.db")
+        st.record_cspan_search("house.fresh", 1)
+        conn = st._get_conn()
+        old = (datetime.now(timezone.utc) - timedelta(days=9)).isoformat()
+        conn.execute("INSERT INTO cspan_searches VALUES (?, ?, 0)", ("house.stale", old))
+        conn.commit()
+        searched = []
+        self._patch(monkeypatch, {})
+        real_run = cspan._run_searches
+        monkeypatch.setattr(
+            "cspan._run_searches",
+            lambda queue, *a, **kw: (searched.extend(k for k, _ in queue),
+                                     real_run(queue, *a, **kw))[1])
+        committees = {
+            "house.fresh": {"cspan_id": "1"},
+            "house.stale": {"cspan_id": "2"},
+            "house.new": {"cspan_id": "3"},
+        }
+
+        cspan.discover_cspan_rotation(committees, state=st)
+
+        assert searched == ["house.new", "house.stale"]
+
+    def test_targeted_searches_run_concurrently_and_match_by_date(self, monkeypatch):
+        results = {
+            "tariff oversight": [{"program_id": "1", "url": "u1", "date": "2026-01-05"}],
+            "budget review": [{"program_id": "2", "url": "u2", "date": "2026-01-09"}],
+        }
+        browser = self._patch(monkeypatch, results)
+        monkeypatch.setattr("cspan._extract_search_keywords", lambda title: title)
+        hearings = [
+            {"id": "h1", "title": "tariff oversight", "date": "2026-01-05"},
+            {"id": "h2", "title": "budget review", "date": "2026-01-10"},
+            {"id": "h3", "title": "", "date": "2026-01-10"},
+        ]
+
+        found = cspan.discover_cspan_targeted(hearings)
+
+        assert [(r["hearing_id"], r["cspan_url"]) for r in found] == [("h1", "u1")]
+        assert browser.new_context.call_count == cspan._SEARCH_WORKERS
+
+    def test_waf_block_persisted_and_honored(self, monkeypatch, tmp_path):
+        from state import State
+
+        st = State(db_path=tmp_path / "test.db")
+        browser = self._patch(monkeypatch, {}, waf_ids={"0"})
+        committees = {"house.c0": {"cspan_id": "0"}, "house.c1": {"cspan_id": "1"}}
+
+        cspan.discover_cspan_by_committee(["house.c0"], committees, state=st)
+        assert st.get_cspan_waf_blocked_until() > datetime.now(timezone.utc)
+
+        contexts_before = browser.new_context.call_count
+        assert cspan.discover_cspan_by_committee(["house.c1"], committees, state=st) == []
+        assert cspan.discover_cspan_rotation(committees, state=st) == []
+        assert browser.new_context.call_count == contexts_before
+
+    def test_repeated_runs_reuse_the_browser_worker_threads(self, monkeypatch):
+        browser = self._patch(monkeypatch, {})
+        threads = set()
+        monkeypatch.setattr(
+            "cspan._get_browser", lambda: (threads.add(threading.get_ident()), browser)[1])
+        queue = [(f"house.c{i}", cspan._sponsor_search_url(str(i))) for i in range(4)]
+        cutoff = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        cspan._run_searches(queue, cutoff, "test")
+        cspan._run_searches(queue, cutoff, "test")
+
+        assert threads == {w._thread.ident for w in cspan._browser_workers()}
+
+    def test_browser_error_outside_a_search_stops_only_that_stripe(self, monkeypatch):
+        from playwright.sync_api import Error as PlaywrightError
+
+        self._patch(monkeypatch, {})
+
+        def _recycle(context, page, pages_loaded):
+            if pages_loaded:
+                raise PlaywrightError("Target closed")
+            return context, page
+
+        monkeypatch.setattr("cspan._maybe_recycle_context", _recycle)
+        queue = [(f"house.c{i}", cspan._sponsor_search_url(str(i))) for i in range(4)]
+
+        outcomes, _, _ = cspan._run_searches(
+            queue, datetime(2026, 1, 1, tzinfo=timezone.utc), "test", workers=2)
+
+        assert sorted(outcomes) == ["house.c0", "house.c1"]
+
+    def test_cooldown_holds_gate_and_sets_stop_when_still_blocked(self, monkeypatch):
+        gate, stop = threading.Lock(), threading.Event()
+        held_during_sleep = []
+        monkeypatch.setattr("cspan._time.sleep", lambda s: held_during_sleep.append(gate.locked()))
+        monkeypatch.setattr("cspan._rate_limit", lambda *a: None)
+        page = MagicMock()
+        page.evaluate.return_value = True  # captcha, before and after cooldown
+        monkeypatch.setattr("cspan._new_cspan_context", lambda: (MagicMock(), page))
+
+        _, _, waf_blocked = cspan._navigate_with_waf_recovery(
+            MagicMock(), page, "https://www.c-span.org/search/", "test", gate, stop)
+
+        assert waf_blocked and stop.is_set()
+        assert held_during_sleep == [True]
+        assert not gate.locked()
+
+
+class TestDirectTranscriptFetch:
+    _PW_COOKIES = [
+        {"name": "aws-waf-token", "value": "tok", "domain": ".c-span.org", "expires": -1},
+        {"name": "_ga", "value": "x", "domain": ".google.com", "expires": -1},
+    ]
+
+    def test_no_cached_cookies_skips_http(self):
+        with patch("cspan.httpx.get") as mock_get:
+            assert cspan._fetch_transcript_direct("672588") is None
+        mock_get.assert_not_called()
+
+    def test_saved_cookies_persist_across_runs(self, monkeypatch):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        monkeypatch.setattr("cspan._waf_cookies", None)  # simulate a new process
+        assert cspan._load_waf_cookies() == {"aws-waf-token": "tok"}
+
+    def test_expired_cookies_ignored(self, monkeypatch):
+        cspan._save_waf_cookies([
+            {"name": "aws-waf-token", "value": "old", "domain": "www.c-span.org", "expires": 1},
+        ])
+        monkeypatch.setattr("cspan._waf_cookies", None)
+        assert cspan._load_waf_cookies() == {}
+
+    @patch("cspan._rate_limit", lambda *a: None)
+    def test_uses_cached_cookies(self):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        request = httpx.Request("GET", cspan._TRANSCRIPT_API_URL)
+        resp = httpx.Response(200, json={"parts": [{"text": "HELLO"}]}, request=request)
+        with patch("cspan.httpx.get", return_value=resp) as mock_get:
+            text = cspan._fetch_transcript_direct("672588")
+        assert json.loads(text) == {"parts": [{"text": "HELLO"}]}
+        assert mock_get.call_args.kwargs["cookies"] == {"aws-waf-token": "tok"}
+        assert mock_get.call_args.kwargs["params"]["videoId"] == "672588"
+
+    @patch("cspan._rate_limit", lambda *a: None)
+    def test_forbidden_clears_cache(self):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        request = httpx.Request("GET", cspan._TRANSCRIPT_API_URL)
+        with patch("cspan.httpx.get", return_value=httpx.Response(403, request=request)):
+            assert cspan._fetch_transcript_direct("672588") is None
+        assert cspan._load_waf_cookies() == {}
+        assert not cspan.config.CSPAN_COOKIES_JSON.exists()
+
+    @patch("cspan._rate_limit", lambda *a: None)
+    def test_html_challenge_rejected(self):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        request = httpx.Request("GET", cspan._TRANSCRIPT_API_URL)
+        resp = httpx.Response(200, text="<html>confirm you are human</html>", request=request)
+        with patch("cspan.httpx.get", return_value=resp):
+            assert cspan._fetch_transcript_direct("672588") is None
+
+    @patch("cspan._rate_limit", lambda *a: None)
+    def test_fetch_transcript_skips_browser_when_cookies_work(self, tmp_path, monkeypatch):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        browser = MagicMock()
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+        request = httpx.Request("GET", cspan._TRANSCRIPT_API_URL)
+        resp = httpx.Response(
+            200, json={"parts": [{"cc_name": "Sen. Smith", "text": "HELLO THERE."}]},
+            request=request)
+        with patch("cspan.httpx.get", return_value=resp):
+            path = cspan.fetch_cspan_transcript(
+                "https://www.c-span.org/program/senate-committee/hearing/672588",
+                tmp_path / "out")
+
+        assert path is not None and "Sen. Smith:" in path.read_text()
+        browser.new_context.assert_not_called()
+
+
+class TestDiscoveryCookieReuse:
+    _PW_COOKIES = TestDirectTranscriptFetch._PW_COOKIES
+
+    def test_new_context_seeded_from_cache(self, monkeypatch):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        browser = MagicMock()
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+
+        context, _ = cspan._new_cspan_context()
+
+        context.add_cookies.assert_called_once_with([
+            {"name": "aws-waf-token", "value": "tok", "url": "https://www.c-span.org"}])
+
+    def test_storage_state_not_overridden(self, monkeypatch):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        browser = MagicMock()
+        monkeypatch.setattr("cspan._get_browser", lambda: browser)
+
+        context, _ = cspan._new_cspan_context(storage_state={"cookies": []})
+
+        context.add_cookies.assert_not_called()
+
+    def test_captcha_drops_cached_token_then_saves_fresh_one(self, monkeypatch):
+        cspan._save_waf_cookies(self._PW_COOKIES)
+        monkeypatch.setattr("cspan._time.sleep", lambda s: None)
+        monkeypatch.setattr("cspan._rate_limit", lambda *a: None)
+        monkeypatch.setattr("cspan._wait_for_results", lambda page: None)
+        blocked_context, blocked_page = MagicMock(), MagicMock()
+        blocked_page.evaluate.return_value = True  # captcha
+        fresh_context, fresh_page = MagicMock(), MagicMock()
+        fresh_page.evaluate.return_value = False
+        fresh_context.cookies.return_value = [
+            {"name": "aws-waf-token", "value": "new", "domain": "www.c-span.org"}]
+        seeded = []
+
+        def _fresh_context():
+            seeded.append(cspan._load_waf_cookies())
+            return fresh_context, fresh_page
+        monkeypatch.setattr("cspan._new_cspan_context", _fresh_context)
+
+        context, _, waf_blocked = cspan._navigate_with_waf_recovery(
+            blocked_context, blocked_page, "https://www.c-span.org/search/", "test")
+
+        assert context is fresh_context and not waf_blocked
+        assert seeded == [{}]
+        assert cspan._load_waf_cookies() == {"aws-waf-token": "new"}
+
+
+class TestWaitForResults:
+    def test_returns_when_ready(self):
+        page = MagicMock()
+        cspan._wait_for_results(page)
+        page.wait_for_function.assert_called_once()
+        page.wait_for_timeout.assert_not_called()
+
+    def test_timeout_is_not_an_error(self):
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        page = MagicMock()
+        page.wait_for_function.side_effect = PlaywrightTimeoutError("timed out")
+        cspan._wait_for_results(page)  # should not raise
+
+
+class TestParseSearchRows:
+    CUTOFF = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    DATE = "FEBRUARY 5, 2026"
+
+    def _rows(self):
+        href = "/program/senate-committee/treasury-secretary-testifies/672588"
+        return [
+            {"href": href, "text": "", "dateText": self.DATE},  # image link
+            {"href": href, "text": "Treasury Secy. Bessent Testifies", "dateText": self.DATE},
+            {"href": href, "text": "Treasury Secy. Bessent Testifies", "dateText": self.DATE},
+            {"href": "//www.c-span.org/event/house-hearing/budget/434689",
+             "text": "House Budget Committee Hearing", "dateText": "MARCH 2, 2026"},
+        ]
+
+    def test_parses_and_dedups(self):
+        hearings = cspan._parse_search_rows(self._rows(), self.CUTOFF)
+        assert [h["program_id"] for h in hearings] == ["672588", "434689"]
+        assert hearings[0]["url"].startswith("https://www.c-span.org/program/")
+        assert hearings[0]["date"] == "2026-02-05"
+        assert hearings[1]["url"].startswith("https://www.c-span.org/event/")
+
+    def test_filters_before_cutoff(self):
+        cutoff = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        hearings = cspan._parse_search_rows(self._rows(), cutoff)
+        assert [h["program_id"] for h in hearings] == ["434689"]
+
+    def test_missing_parent_skipped(self):
+        rows = [{"href": "/program/x/y/1234", "text": "Some Long Hearing Title", "dateText": None}]
+        assert cspan._parse_search_rows(rows, self.CUTOFF) == []
+
+    def test_undated_parent_skipped(self):
+        rows = [{"href": "/program/x/y/1234", "text": "Some Long Hearing Title", "dateText": ""}]
+        assert cspan._parse_search_rows(rows, self.CUTOFF) == []
+
+    def test_rows_js_matches_every_month(self):
+        assert "dateRe = /(?:JANUARY|" in cspan._SEARCH_ROWS_JS
+        assert all(month in cspan._SEARCH_ROWS_JS for month in cspan._MONTHS)
+        assert r"\s+\d{1,2},?\s+\d{4}/" in cspan._SEARCH_ROWS_JS
+
+    def test_page_uses_single_evaluate(self):
+        page = MagicMock()
+        page.evaluate.return_value = self._rows()
+        hearings = cspan._parse_search_results(page, self.CUTOFF)
+        assert len(hearings) == 2
+        page.evaluate.assert_called_once()
+        page.query_selector_all.assert_not_called()
+
+
+class TestIterTranscriptParts:
+    RAW = json.dumps({"parts": [
+        {"cc_name": "Sen. Smith", "text": "HELLO.", "secAppOffset": 1.5},
+        {"cc_name": "Sen. Jones", "text": "GOODBYE.", "secAppOffset": 3},
+    ]})
+
+    def test_yields_parts(self):
+        parts = list(cspan._iter_transcript_parts(self.RAW))
+        assert [p["cc_name"] for p in parts] == ["Sen. Smith", "Sen. Jones"]
+        assert parts[0]["secAppOffset"] == 1.5
+
+    def test_json_fallback_without_ijson(self, monkeypatch):
+        monkeypatch.setattr("cspan.ijson", None)
+        monkeypatch.setattr("cspan.orjson", None)
+        parts = list(cspan._iter_transcript_parts(self.RAW))
+        assert len(parts) == 2
+
+    def test_orjson_fallback_without_ijson(self, monkeypatch):
+        pytest.importorskip("orjson")
+        monkeypatch.setattr("cspan.ijson", None)
+        parts = list(cspan._iter_transcript_parts(self.RAW))
+        assert [p["text"] for p in parts] == ["HELLO.", "GOODBYE."]
+        with pytest.raises(cspan._TRANSCRIPT_JSON_ERRORS):
+            list(cspan._iter_transcript_parts('{"parts": [{"text": '))
+
+    def test_missing_parts_yields_nothing(self):
+        assert list(cspan._iter_transcript_parts('{"other": 1}')) == []
+
+    def test_invalid_json_raises_known_error(self):
+        with pytest.raises(cspan._TRANSCRIPT_JSON_ERRORS):
+            list(cspan._iter_transcript_parts('{"parts": [{"text": '))
+
+    def test_build_transcript_accepts_iterator(self):
+        result = _build_transcript(cspan._iter_transcript_parts(self.RAW))
+        assert "Sen. Smith:" in result and "Sen. Jones:" in result
+
+
+class TestDiscoverCspanGoogle:
+    _HTML = '<a href="https://www.c-span.org/program/senate-committee/hearing/672588">'
+
+    def _hearings(self, n):
+        return [{"id": f"h{i}", "title": f"Oversight of tariff policy {i}",
+                 "date": "2026-01-05", "committee_name": "Finance"} for i in range(n)]
+
+    def test_reuses_one_client_across_queries(self, monkeypatch):
+        monkeypatch.setattr("cspan._ddg_limiter", MagicMock())
+        with patch("cspan.httpx.Client") as client_cls:
+            client = client_cls.return_value
+            client.post.return_value = MagicMock(status_code=200, text=self._HTML)
+
+            found = cspan.discover_cspan_google(self._hearings(3))
+
+        client_cls.assert_called_once()
+        assert client.post.call_count == 3
+        client.close.assert_called_once()
+        assert [r["program_id"] for r in found] == ["672588"] * 3
+
+    def test_query_includes_year_from_iso_date(self, monkeypatch):
+        monkeypatch.setattr("cspan._ddg_limiter", MagicMock())
+        client = MagicMock()
+        client.post.return_value = MagicMock(status_code=200, text="")
+        hearings = self._hearings(1) + [{"id": "h9", "title": "Oversight of tariff policy",
+                                         "date": "bad", "committee_name": "Finance"}]
+
+        cspan.discover_cspan_google(hearings, client=client)
+
+        queries = {c.kwargs["data"]["q"] for c in client.post.call_args_list}
+        assert queries == {"c-span.org Finance tariff policy 2026",
+                           "c-span.org Finance tariff policy"}
+
+    def test_caller_client_left_open(self, monkeypatch):
+        monkeypatch.setattr("cspan._ddg_limiter", MagicMock())
+        client = MagicMock()
+        client.post.return_value = MagicMock(status_code=200, text="")
+
+        cspan.discover_cspan_google(self._hearings(1), client=client)
+
+        client.post.assert_called_once()
+        client.close.assert_not_called()
+
+    def test_results_keep_hearing_order_and_respect_cap(self, monkeypatch):
+        limiter = MagicMock()
+        monkeypatch.setattr("cspan._ddg_limiter", limiter)
+        client = MagicMock()
+        client.post.side_effect = lambda url, data, **kw: MagicMock(
+            status_code=200,
+            text=f'<a href="https://www.c-span.org/program/x/hearing/{data["q"].split()[2]}">')
+        hearings = [{"id": f"h{i}", "title": "Oversight of tariff policy",
+                     "committee_name": f"Finance {i}"} for i in range(5)]
+
+        found = cspan.discover_cspan_google(hearings, max_searches=4, client=client)
+
+        assert [r["program_id"] for r in found] == ["0", "1", "2", "3"]
+        assert limiter.wait.call_count == 4
+
+    def test_result_urls_unwrap_redirects_and_skip_scripts(self):
+        html = (
+            "<script>var u='https://www.c-span.org/program/x/hearing/111111';</script>"
+            '<a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fwww.c-span.org'
+            '%2Fprogram%2Fsenate-committee%2Fhearing%2F672588&amp;rut=abc">Hearing</a>'
+            '<a href="https://www.example.com/program/a/b/1">other</a>'
+            '<a href="https://www.c-span.org/event/house-committee/hearing/500">Event</a>'
+        )
+
+        assert list(cspan._ddg_result_urls(html)) == [
+            "https://www.c-span.org/program/senate-committee/hearing/672588",
+            "https://www.c-span.org/event/house-committee/hearing/500",
+        ]
@@ -1,5 +1,11 @@
 """Tests for detail_scraper.py -- per-platform testimony PDF extraction."""
 
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit
+
+import httpx
+
+import detail_scraper
 from detail_scraper import (
     _abs_url,
     _extract_coldfusion,
@@ -43,6 +49,13 @@ class TestAbsUrl:
     def test_hash_href(self):
         assert _abs_url("#section", "https://example.com") == ""
 
+    def test_fast_path_matches_abs_url(self):
+        base_url = "https://user@finance.senate.gov:8443/hearings/page?x=1"
+        base = urlsplit(base_url)
+        for href in ("/files/t.pdf", "/files/t.pdf?a=1#p", "//cdn.senate.gov/t.pdf",
+                     "/a/../t.pdf", "t.pdf", "?page=2", "#top", "https://x.gov/t.pdf"):
+            assert detail_scraper._abs_url_fast(href, base, base_url) == _abs_url(href, base_url)
+
 
 class TestIsPdfHref:
     def test_pdf_extension(self):
@@ -73,6 +86,50 @@ class TestIsPdfHref:
         assert _is_pdf_href("/images/photo.jpg") is False
 
 
+def _first_link(html: str):
+    return detail_scraper._parse_page(html).xpath(".//a")[0]
+
+
+class TestLinkSignals:
+    def test_exclusion_after_testimony_keyword_wins(self):
+        link = _first_link('<ul><li><a href="/x.pdf">Testimony video</a></li></ul>')
+        assert _should_exclude(link, "/x.pdf") is True
+
+    def test_excluded_by_href(self):
+        link = _first_link('<ul><li><a href="/share/x.pdf">Testimony</a></li></ul>')
+        assert _should_exclude(link, "/share/x.pdf") is True
+
+    def test_testimony_text_flag_reused(self):
+        link = _first_link('<ul><li><a href="/x.pdf">Written Testimony</a></li></ul>')
+        signals = detail_scraper._link_signals(link, "/x.pdf")
+        assert signals == detail_scraper._SIG_TESTIMONY
+        assert _has_testimony_signal(link, signals) is True
+
+    def test_script_text_ignored(self):
+        link = _first_link(
+            '<ul><li><script>var testimony = 1;</script><!-- statement -->'
+            '<a href="/x.pdf">Smith</a> bio</li></ul>')
+        assert _has_testimony_signal(link, 0) is False
+        assert detail_scraper._text_content(link.getparent()) == "Smith bio"
+
+    def test_parent_check_memoized_per_parent(self):
+        doc = detail_scraper._parse_page(
+            '<p>Prepared statements: <a href="/a.pdf">Smith</a> <a href="/b.pdf">Jones</a></p>')
+        first, second = doc.xpath(".//a")
+        parent_hits = {}
+        assert _has_testimony_signal(first, 0, parent_hits) is True
+        assert list(parent_hits.values()) == [True]
+        # The sibling reuses the memo entry instead of re-reading the text
+        parent_hits[first.getparent()] = False
+        assert _has_testimony_signal(second, 0, parent_hits) is False
+        assert len(parent_hits) == 1
+
+    def test_parent_text_still_checked(self):
+        link = _first_link('<ul><li>Prepared remarks: <a href="/x.pdf">Smith</a></li></ul>')
+        assert detail_scraper._link_signals(link, "/x.pdf") == 0
+        assert _has_testimony_signal(link, 0) is True
+
+
 # ===========================================================================
 #  Senate: drupal_table / new_senate_cms extractor
 # ===========================================================================
@@ -353,6 +410,16 @@ class TestExtractAspnetCard:
         for url in urls:
             assert url.startswith("https://"), f"URL not absolute: {url}"
 
+    def test_matching_sections_searched_first_case_insensitive(self):
+        html = """
+        <html><body>
+            <div class="nav"><a href="https://docs.house.gov/agenda.pdf">Agenda</a></div>
+            <div class="Witness-List"><a href="https://docs.house.gov/smith.pdf">Smith</a></div>
+        </body></html>
+        """
+        urls = _extract_aspnet_card(html, "https://armedservices.house.gov")
+        assert urls == ["https://docs.house.gov/smith.pdf", "https://docs.house.gov/agenda.pdf"]
+
 
 # ===========================================================================
 #  Generic fallback extractor
@@ -410,6 +477,26 @@ class TestExtractPdfLinksGenericFallback:
         assert len(urls) == 2
         assert all(u.endswith(".pdf") for u in urls)
 
+    def test_container_keyword_checked_once_per_ancestor(self):
+        html = """
+        <html><body>
+            <div class="witness-docs"><ul>
+                <li><a href="/data/a.pdf">Smith</a></li>
+                <li><a href="/data/b.pdf">Jones</a></li>
+                <li><a href="/data/c.pdf">Lee</a></li>
+            </ul></div>
+            <a href="/data/report.pdf">Annual Report</a>
+        </body></html>
+        """
+        keywords = Mock(wraps=detail_scraper._TESTIMONY_KEYWORDS)
+        with patch.object(detail_scraper, "_TESTIMONY_KEYWORDS", keywords):
+            urls = _extract_pdf_links(html, "https://example.gov")
+
+        assert urls == [f"https://example.gov/data/{n}.pdf" for n in "abc"]
+        container_checks = [c for c in keywords.search.call_args_list
+                            if "witness-docs" in c.args[0]]
+        assert len(container_checks) == 1
+
 
 # ===========================================================================
 #  Edge cases
@@ -505,6 +592,50 @@ class TestRelativeUrlResolution:
         assert urls[0] == "https://example.gov/hearing/detail/docs/written-testimony.pdf"
 
 
+class TestHrefPrefilter:
+    HTML = """
+    <html><body>
+        <nav><a href="/about">Witness information</a><a href="/hearings">Hearings</a></nav>
+        <ul>
+            <li><a href="/files/smith-testimony.docx">Testimony of Smith</a></li>
+            <li><a href="/wp-content/uploads/2026/01/jones.pdf/view">Jones</a></li>
+        </ul>
+    </body></html>
+    """
+
+    def test_nav_links_never_classified(self):
+        with patch("detail_scraper._link_signals",
+                   wraps=detail_scraper._link_signals) as signals:
+            urls = _extract_drupal_senate(self.HTML, "https://finance.senate.gov")
+        assert urls == ["https://finance.senate.gov/files/smith-testimony.docx"]
+        assert signals.call_count == 2
+
+    def test_document_markers_pass(self):
+        assert detail_scraper._could_be_document("/wp-content/uploads/2026/01/jones.pdf/view")
+        assert detail_scraper._could_be_document("https://docs.house.gov/Committee/Calendar")
+        assert detail_scraper._could_be_document("/index.cfm?a=x&File_id=ABC")
+        assert not detail_scraper._could_be_document("/hearings/2026/budget-review")
+
+
+class TestMaxLinks:
+    HTML = """
+    <html><body>
+        <div class="entry-content"><a href="/files/a-testimony.pdf">Testimony A</a></div>
+        <div class="entry-content"><a href="/files/b-testimony.pdf">Testimony B</a></div>
+    </body></html>
+    """
+
+    def test_stops_after_container_reaching_limit(self):
+        urls = detail_scraper._extract_links_from_containers(
+            self.HTML, "https://intelligence.senate.gov",
+            container_fn=detail_scraper._WP_CONTAINERS, max_links=1)
+        assert urls == ["https://intelligence.senate.gov/files/a-testimony.pdf"]
+
+    def test_default_searches_all_containers(self):
+        urls = _extract_wordpress(self.HTML, "https://intelligence.senate.gov")
+        assert len(urls) == 2
+
+
 class TestDeduplication:
     """Verify that duplicate URLs within a single page are deduplicated."""
 
@@ -521,6 +652,36 @@ class TestDeduplication:
         count = sum(1 for u in urls if "testimony.pdf" in u)
         assert count == 1
 
+    def test_repeated_href_resolved_once(self):
+        html = """
+        <html><body>
+            <a href="/download/testimony.pdf">Testimony of Smith</a>
+            <a href="/download/testimony.pdf">Download Smith Testimony</a>
+        </body></html>
+        """
+        for extract in (_extract_drupal_senate, _extract_pdf_links):
+            with patch("detail_scraper._abs_url_fast",
+                       wraps=detail_scraper._abs_url_fast) as abs_url:
+                urls = extract(html, "https://finance.senate.gov")
+            assert urls == ["https://finance.senate.gov/download/testimony.pdf"]
+            assert abs_url.call_count == 1
+
+    def test_trailing_slash_variants_collapse(self):
+        html = """
+        <html><body>
+            <a href="/download/smith">Testimony of Smith</a>
+            <a href="/download/smith/">Smith Testimony</a>
+            <a href="https://finance.senate.gov/download/smith">Testimony (PDF)</a>
+        </body></html>
+        """
+        for extract in (_extract_drupal_senate, _extract_pdf_links):
+            with patch("detail_scraper._link_signals",
+                       wraps=detail_scraper._link_signals) as signals:
+                urls = extract(html, "https://finance.senate.gov")
+            assert urls == ["https://finance.senate.gov/download/smith"]
+        # The generic extractor skips classifying repeats of accepted testimony
+        assert signals.call_count == 1
+
 
 class TestExcludeKeywords:
     """Verify that social media and media links are excluded."""
@@ -574,3 +735,150 @@ class TestEmptyAndMinimalInput:
         </body></html>
         """
         assert _extract_pdf_links(html, "https://example.com") == []
+
+
+# ===========================================================================
+#  scrape_hearing_detail
+# ===========================================================================
+
+
+class TestExtractYoutubeEmbeds:
+    def test_raw_html_without_embed_not_parsed(self):
+        with patch("detail_scraper._parse_page") as parse:
+            assert detail_scraper._extract_youtube_embeds(DRUPAL_SENATE_HTML) == []
+        parse.assert_not_called()
+
+    def test_only_iframe_embeds_count(self):
+        html = """
+        <html><body>
+            <a href="https://www.youtube.com/embed/linkedvideo">Watch</a>
+            <iframe src="https://www.youtube.com/embed/abcdefghijk?rel=0"></iframe>
+            <iframe src="https://www.youtube.com/embed/abcdefghijk"></iframe>
+        </body></html>
+        """
+        embeds = detail_scraper._extract_youtube_embeds(html)
+        assert [e["youtube_id"] for e in embeds] == ["abcdefghijk"]
+
+
+class TestScrapeHearingDetail:
+    def test_page_parsed_once(self):
+        html = DRUPAL_SENATE_HTML.replace(
+            "</body>", '<iframe src="https://www.youtube.com/embed/abcdefghijk"></iframe></body>')
+        meta = {"chamber": "senate", "scraper_type": "drupal_table"}
+        with patch("detail_scraper._fetch_detail_page", return_value=html), \
+                patch("detail_scraper._parse_page", wraps=detail_scraper._parse_page) as parse:
+            result = detail_scraper.scrape_hearing_detail(
+                "senate.finance", "https://finance.senate.gov/hearings/x", meta)
+
+        assert parse.call_count == 1
+        assert result.youtube_id == "abcdefghijk"
+        assert "https://finance.senate.gov/download/testimony-smith.pdf" in result.pdf_urls
+
+    def test_generic_type_not_rerun_as_fallback(self):
+        html = '<html><body><a href="/about">About</a></body></html>'
+        meta = {"chamber": "house", "scraper_type": "html_table"}
+        with patch("detail_scraper._fetch_detail_page", return_value=html), \
+                patch("detail_scraper._is_pdf_href", return_value=False) as is_pdf:
+            result = detail_scraper.scrape_hearing_detail(
+                "house.energy", "https://energycommerce.house.gov/hearings/x", meta)
+
+        assert result.pdf_urls == []
+        assert is_pdf.call_count == 1
+
+    def test_xml_declaration_and_empty_pages_parse(self):
+        html = '<?xml version="1.0" encoding="utf-8"?>\n' + DRUPAL_SENATE_HTML
+        assert _extract_drupal_senate(html, "https://finance.senate.gov")
+        assert _extract_drupal_senate("   ", "https://finance.senate.gov") == []
+
+
+class TestFetchDetailPage:
+    def test_client_shared_across_fetches(self, monkeypatch):
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, text="<html></html>")
+
+        created = []
+
+        def make_client(**kwargs):
+            client = httpx.Client(transport=httpx.MockTransport(handler))
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(detail_scraper, "_client", None)
+        monkeypatch.setattr(detail_scraper, "get_http_client", make_client)
+        monkeypatch.setattr(detail_scraper._rate_limiter, "wait", lambda domain: 0.0)
+
+        assert detail_scraper._fetch_detail_page("https://a.senate.gov/h/1") == "<html></html>"
+        assert detail_scraper._fetch_detail_page("https://a.senate.gov/missing") is None
+        assert detail_scraper._fetch_detail_page("https://a.senate.gov/h/2") == "<html></html>"
+
+        assert len(created) == 1 and not created[0].is_closed
+        assert len(requested) == 3
+        detail_scraper._close_client()
+        assert created[0].is_closed
+
+    def test_transport_error_keeps_shared_client(self, monkeypatch):
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(detail_scraper, "_client", client)
+        monkeypatch.setattr(detail_scraper._rate_limiter, "wait", lambda domain: 0.0)
+
+        assert detail_scraper._fetch_detail_page("https://a.senate.gov/h/1") is None
+        assert detail_scraper._client is client and not client.is_closed
+        client.close()
+
+
+class TestScrapeHearingDetails:
+    def test_interleaves_hosts_and_keeps_input_order(self):
+        targets = [
+            ("senate.finance", "https://finance.senate.gov/h/1", {}),
+            ("senate.finance", "https://finance.senate.gov/h/2", {}),
+            ("senate.finance", "https://finance.senate.gov/h/3", {}),
+            ("house.judiciary", "https://judiciary.house.gov/h/1", {}),
+        ]
+        fetched = []
+
+        def fake_scrape(committee_key, detail_url, committee_meta):
+            fetched.append(detail_url)
+            if detail_url.endswith("/2"):
+                raise OSError("connection reset")
+            return detail_scraper.DetailResult(pdf_urls=[detail_url + ".pdf"])
+
+        with patch("detail_scraper.scrape_hearing_detail", side_effect=fake_scrape):
+            results = detail_scraper.scrape_hearing_details(targets, workers=1)
+
+        assert fetched == [
+            "https://finance.senate.gov/h/1", "https://judiciary.house.gov/h/1",
+            "https://finance.senate.gov/h/2", "https://finance.senate.gov/h/3",
+        ]
+        assert [r.pdf_urls for r in results] == [
+            ["https://finance.senate.gov/h/1.pdf"], [],
+            ["https://finance.senate.gov/h/3.pdf"], ["https://judiciary.house.gov/h/1.pdf"],
+        ]
+
+    def test_shared_detail_page_fetched_once(self):
+        senate = {"chamber": "senate", "scraper_type": "drupal_table"}
+        targets = [
+            ("senate.finance", "https://finance.senate.gov/h/joint", senate),
+            ("senate.budget", "https://finance.senate.gov/h/joint", dict(senate)),
+            ("house.judiciary", "https://finance.senate.gov/h/joint",
+             {"chamber": "house", "scraper_type": "evo_framework"}),
+        ]
+        fetched = []
+
+        def fake_scrape(committee_key, detail_url, committee_meta):
+            fetched.append(committee_key)
+            return detail_scraper.DetailResult(pdf_urls=[detail_url + ".pdf"], isvp_comm="fin")
+
+        with patch("detail_scraper.scrape_hearing_detail", side_effect=fake_scrape):
+            results = detail_scraper.scrape_hearing_details(targets, workers=2)
+
+        assert sorted(fetched) == ["house.judiciary", "senate.finance"]
+        assert results[0] == results[1]
+        assert results[0].pdf_urls is not results[1].pdf_urls
@@ -1,7 +1,9 @@
 """Tests for digest.py — hearing transcript digest pipeline."""
 
 import json
+import sqlite3
 from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -13,9 +15,11 @@ from digest import (
     _events_to_transcripts,
     _markdown_to_simple_html,
     compose_digest,
+    extract_quotes_from_transcripts,
     find_recent_transcripts,
     score_quotes,
 )
+from state import State
 
 
 class TestFindRecentTranscripts:
@@ -141,6 +145,27 @@ class TestFindRecentTranscripts:
 
         assert len(result) == 1
 
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_streamed_and_loaded_index_agree(self, tmp_path, monkeypatch, streaming):
+        today = date.today().isoformat()
+        hearings = [
+            {"id": "old", "title": "Old", "committee": "senate.finance",
+             "date": "2020-01-01", "path": "senate-finance/old"},
+            {"id": "new", "title": "New", "committee": "house.judiciary",
+             "date": today, "path": "house-judiciary/new"},
+            {"id": "new", "title": "New (copy)", "committee": "house.judiciary",
+             "date": today, "path": "house-judiciary/new"},
+        ]
+        transcripts_dir = self._setup_transcripts_dir(tmp_path, hearings)
+        monkeypatch.setattr("config.TRANSCRIPTS_DIR", transcripts_dir)
+        if not streaming:
+            monkeypatch.setattr("digest.ijson", None)
+
+        result = find_recent_transcripts(lookback_days=7)
+
+        assert [t["id"] for t in result] == ["new"]
+        assert result[0]["title"] == "New"
+
 
 class TestEventsToTranscripts:
     def test_maps_valid_transcript_published_events(self, tmp_path):
@@ -267,6 +292,143 @@ class TestMarkdownToSimpleHtml:
         assert bq_close < p_open
 
 
+class TestExtractQuotesFromTranscripts:
+    """Tests for extract_quotes_from_transcripts — concurrent chunk fan-out."""
+
+    def _make_transcript(self, tmp_path, hearing_id: str, paragraphs: list[str]) -> dict:
+        path = tmp_path / f"{hearing_id}.txt"
+        path.write_text("\n\n".join(paragraphs), encoding="utf-8")
+        return {
+            "id": hearing_id,
+            "title": f"Hearing {hearing_id}",
+            "committee": "senate.finance",
+            "date": "2026-02-14",
+            "transcript_path": str(path),
+            "meta": {"sources": {"youtube_id": "abc"}},
+        }
+
+    def test_quotes_keep_transcript_and_chunk_order(self, tmp_path, monkeypatch):
+        transcripts = [
+            self._make_transcript(tmp_path, "h1", ["a" * 15000, "b" * 15000]),
+            self._make_transcript(tmp_path, "empty", ["   "]),
+            self._make_transcript(tmp_path, "h2", ["c" * 100]),
+        ]
+        clients = set()
+
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
+            clients.add(client)
+            marker = prompt.rstrip()[-1]
+            if marker == "b":
+                request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+                raise httpx.ConnectError("connection reset", request=request)
+            return {
+                "choices": [{"message": {"content": json.dumps([{"quote": marker}])}}],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 50},
+            }
+
+        monkeypatch.setattr("digest.call_openrouter", mock_call)
+        monkeypatch.setattr("digest.calculate_cost", lambda model, inp, out: 0.01)
+
+        quotes, cost = extract_quotes_from_transcripts(transcripts, "fake-key", workers=3)
+
+        assert [(q.text, q.hearing_title) for q in quotes] == [
+            ("a", "Hearing h1"), ("c", "Hearing h2"),
+        ]
+        assert quotes[0].source_url == "https://www.youtube.com/watch?v=abc"
+        assert cost == pytest.approx(0.02)
+        assert len(clients) == 1 and None not in clients
+
+    def test_cached_responses_reused_without_cost(self, tmp_path, monkeypatch):
+        calls = []
+
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
+            calls.append(prompt)
+            return {
+                "choices": [{"message": {"content": json.dumps([{"quote": "q"}])}}],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 50},
+            }
+
+        monkeypatch.setattr("digest.call_openrouter", mock_call)
+        monkeypatch.setattr(
+            "digest.calculate_cost", lambda model, inp, out: 0.01 if inp else 0.0
+        )
+        cache = State(db_path=tmp_path / "test.db")
+        transcripts = [self._make_transcript(tmp_path, "h1", ["some testimony"])]
+
+        first = extract_quotes_from_transcripts(transcripts, "fake-key", cache=cache)
+        second = extract_quotes_from_transcripts(transcripts, "fake-key", cache=cache)
+
+        assert len(calls) == 1
+        assert [q.text for q in first[0]] == [q.text for q in second[0]] == ["q"]
+        assert first[1] == pytest.approx(0.01)
+        assert second[1] == 0.0
+
+    @pytest.mark.parametrize("content,finish_reason", [
+        ("   ", "stop"),
+        ('[{"quote": "q"', "length"),
+        ("not json", "stop"),
+    ])
+    def test_unusable_responses_not_cached(self, tmp_path, monkeypatch, content, finish_reason):
+        calls = []
+
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
+            calls.append(prompt)
+            return {
+                "choices": [{"message": {"content": content}, "finish_reason": finish_reason}],
+                "usage": {},
+            }
+
+        monkeypatch.setattr("digest.call_openrouter", mock_call)
+        cache = State(db_path=tmp_path / "test.db")
+        transcripts = [self._make_transcript(tmp_path, "h1", ["some testimony"])]
+
+        extract_quotes_from_transcripts(transcripts, "fake-key", cache=cache)
+        extract_quotes_from_transcripts(transcripts, "fake-key", cache=cache)
+
+        assert len(calls) == 2
+
+    def test_cache_db_errors_treated_as_miss(self, tmp_path, monkeypatch):
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
+            return {"choices": [{"message": {"content": "not json"}}], "usage": {}}
+
+        monkeypatch.setattr("digest.call_openrouter", mock_call)
+        locked = sqlite3.OperationalError("database is locked")
+        cache = MagicMock(spec=State)
+        cache.get_llm_response.side_effect = locked
+        cache.record_llm_response.side_effect = locked
+        cache.delete_llm_response.side_effect = locked
+        transcripts = [self._make_transcript(tmp_path, "h1", ["some testimony"])]
+
+        assert extract_quotes_from_transcripts(transcripts, "fake-key", cache=cache) == (
+            [], 0.0)
+        cache.record_llm_response.assert_called_once()
+        cache.delete_llm_response.assert_called_once()
+
+    def test_no_chunks_makes_no_calls(self, tmp_path, monkeypatch):
+        mock_call = MagicMock()
+        monkeypatch.setattr("digest.call_openrouter", mock_call)
+
+        transcripts = [self._make_transcript(tmp_path, "empty", [""])]
+        assert extract_quotes_from_transcripts(transcripts, "fake-key") == ([], 0.0)
+        mock_call.assert_not_called()
+
+    @pytest.mark.parametrize("content", [
+        '```json\n[{"quote": "q"}]\n```',
+        '```\n[{"quote": "q"}]```',
+        '  [{"quote": "q"}]  ',
+    ])
+    def test_code_fences_stripped(self, tmp_path, monkeypatch, content):
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
+            return {"choices": [{"message": {"content": content}}], "usage": {}}
+
+        monkeypatch.setattr("digest.call_openrouter", mock_call)
+        transcripts = [self._make_transcript(tmp_path, "h1", ["some testimony"])]
+
+        quotes, _ = extract_quotes_from_transcripts(transcripts, "fake-key")
+
+        assert [q.text for q in quotes] == ["q"]
+
+
 class TestScoreQuotes:
     """Tests for score_quotes with mocked interest model."""
 
@@ -392,7 +554,7 @@ class TestComposeDigest:
     def test_returns_markdown_and_cost(self, monkeypatch):
         monkeypatch.setattr(
             "digest.call_openrouter",
-            lambda prompt, model, api_key, timeout=120.0: {
+            lambda prompt, model, api_key, timeout=120.0, client=None: {
                 "choices": [{"message": {"content": "## Economics\n> quote here"}}],
                 "usage": {"prompt_tokens": 200, "completion_tokens": 100},
             },
@@ -410,7 +572,7 @@ class TestComposeDigest:
     def test_raises_on_http_error(self, monkeypatch):
         """compose_digest does not catch httpx.HTTPError — it must propagate."""
 
-        def mock_call(prompt, model, api_key, timeout=120.0):
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
             request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
             response = httpx.Response(502, request=request)
             raise httpx.HTTPStatusError(
@@ -428,7 +590,7 @@ class TestComposeDigest:
         """Missing keys in response should raise ValueError."""
         monkeypatch.setattr(
             "digest.call_openrouter",
-            lambda prompt, model, api_key, timeout=120.0: {
+            lambda prompt, model, api_key, timeout=120.0, client=None: {
                 "choices": [],  # empty choices
                 "usage": {},
             },
@@ -442,7 +604,7 @@ class TestComposeDigest:
     def test_groups_quotes_by_theme(self, monkeypatch):
         captured_prompts = []
 
-        def mock_call(prompt, model, api_key, timeout=120.0):
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
             captured_prompts.append(prompt)
             return {
                 "choices": [{"message": {"content": "digest body"}}],
@@ -464,3 +626,22 @@ class TestComposeDigest:
         assert len(captured_prompts) == 1
         assert "economics" in captured_prompts[0]
         assert "defense" in captured_prompts[0]
+
+    def test_prompt_same_with_and_without_orjson(self, monkeypatch):
+        captured_prompts = []
+
+        def mock_call(prompt, model, api_key, timeout=120.0, client=None):
+            captured_prompts.append(prompt)
+            return {"choices": [{"message": {"content": "digest body"}}], "usage": {}}
+
+        monkeypatch.setattr("digest.call_openrouter", mock_call)
+        quotes = [
+            self._make_quote(text="\u201cWe\u2019re not there yet\u201d \u2014 caf\u00e9", score=0.8349),
+            self._make_quote(themes=[], text="Plain"),
+        ]
+
+        compose_digest(quotes, "fake-key")
+        monkeypatch.setattr("digest.orjson", None)
+        compose_digest(quotes, "fake-key")
+
+        assert captured_prompts[0] == captured_prompts[1]
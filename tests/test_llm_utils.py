@@ -150,6 +150,7 @@ class TestCallOpenrouter:
         assert payload["messages"][0]["content"] == "Say hello"
         headers = call_args[1]["headers"]
         assert headers["Authorization"] == "Bearer sk-test"
+        assert call_args[1]["timeout"] == 120.0
 
     @patch("llm_utils.httpx.Client")
     def test_without_client_creates_one(self, MockClientClass):
@@ -194,6 +194,21 @@ class TestCspanSearchTracking:
         st.record_cspan_title_search("h1", found=False)
         assert st.is_cspan_searched("h1")
 
+    def test_bulk_title_searches(self, tmp_path):
+        st = State(db_path=tmp_path / "test.db")
+        st.record_cspan_title_searches([("h1", True), ("h2", False)])
+        st.record_cspan_title_searches([("h2", True)])
+        assert st.get_cspan_searched_ids(["h1", "h2", "h3"]) == {"h1", "h2"}
+        row = st._get_conn().execute(
+            "SELECT found FROM cspan_title_searches WHERE hearing_id = 'h2'").fetchone()
+        assert row["found"] == 1
+
+    def test_searched_ids_beyond_parameter_chunk(self, tmp_path):
+        st = State(db_path=tmp_path / "test.db")
+        ids = [f"h{i}" for i in range(1200)]
+        st.record_cspan_title_searches([(i, False) for i in ids[::2]])
+        assert st.get_cspan_searched_ids(ids) == set(ids[::2])
+
     def test_get_stale_committees(self, tmp_path):
         st = State(db_path=tmp_path / "test.db")
 
@@ -216,6 +231,31 @@ class TestCspanSearchTracking:
         stale = st.get_stale_committees(max_age_days=3)
         assert "house.judiciary" not in stale
 
+    def test_get_all_search_ages(self, tmp_path):
+        st = State(db_path=tmp_path / "test.db")
+        assert st.get_all_cspan_search_ages() == {}
+        st.record_cspan_search("house.judiciary", 5)
+        conn = st._get_conn()
+        old_time = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
+        conn.execute("""
+            INSERT INTO cspan_searches (committee_key, last_searched, last_result_count)
+            VALUES (?, ?, ?)
+        """, ("senate.finance", old_time, 0))
+        conn.commit()
+        assert st.get_all_cspan_search_ages() == {"house.judiciary": 0, "senate.finance": 5}
+
+    def test_waf_block_never_recorded(self, tmp_path):
+        st = State(db_path=tmp_path / "test.db")
+        assert st.get_cspan_waf_blocked_until() is None
+
+    def test_record_waf_block_overwrites(self, tmp_path):
+        st = State(db_path=tmp_path / "test.db")
+        first = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+        second = first + timedelta(minutes=30)
+        st.record_cspan_waf_block(first)
+        st.record_cspan_waf_block(second)
+        assert st.get_cspan_waf_blocked_until() == second
+
 
 class TestFindByCongressEventId:
     """Test find_by_congress_event_id lookups."""
@@ -300,6 +340,30 @@ class TestDigestTracking:
         st = State(db_path=tmp_path / "test.db")
         assert st.last_digest_date() is None
 
+    def test_llm_response_cache_roundtrip(self, tmp_path):
+        st = State(db_path=tmp_path / "test.db")
+        assert st.get_llm_response("k1") is None
+        response = {"choices": [{"message": {"content": "hi"}}], "usage": {"prompt_tokens": 3}}
+        st.record_llm_response("k1", "google/gemini", response)
+        assert st.get_llm_response("k1") == response
+
+    def test_llm_response_cache_expiry_and_prune(self, tmp_path):
+        st = State(db_path=tmp_path / "test.db")
+        response = {"choices": [{"message": {"content": "hi"}}]}
+        st.record_llm_response("old", "m", response)
+        st.record_llm_response("new", "m", response)
+        conn = st._get_conn()
+        stale = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+        conn.execute("UPDATE llm_responses SET created_at = ? WHERE cache_key = 'old'", (stale,))
+        conn.commit()
+
+        assert st.get_llm_response("old", max_age=timedelta(days=1)) is None
+        assert st.get_llm_response("new", max_age=timedelta(days=1)) == response
+        assert st.prune_llm_responses(timedelta(days=1)) == 1
+        assert st.get_llm_response("old") is None
+        st.delete_llm_response("new")
+        assert st.get_llm_response("new") is None
+
 
 class TestQueueScaffolding:
     def test_queue_tables_exist(self, tmp_path):
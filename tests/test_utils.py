@@ -1,6 +1,6 @@
 """Tests for utils.py — title normalization and congress calculation."""
 
-from utils import normalize_title
+from utils import RateLimiter, normalize_title
 from config import current_congress
 from discover import Hearing
 
@@ -72,3 +72,33 @@ class TestCurrentCongress:
     def test_reasonable_range(self):
         result = current_congress()
         assert 119 <= result <= 125  # valid range for 2025-2036
+
+
+class TestRateLimiter:
+    def _clock(self, monkeypatch):
+        clock = {"now": 100.0, "slept": []}
+        monkeypatch.setattr("utils.time.monotonic", lambda: clock["now"])
+        monkeypatch.setattr("utils.time.sleep", clock["slept"].append)
+        return clock
+
+    def test_first_request_does_not_wait(self, monkeypatch):
+        clock = self._clock(monkeypatch)
+        assert RateLimiter(min_delay=2.0).wait("a.gov") == 0
+        assert clock["slept"] == []
+
+    def test_back_to_back_requests_spaced(self, monkeypatch):
+        clock = self._clock(monkeypatch)
+        limiter = RateLimiter(min_delay=2.0)
+        limiter.wait("a.gov")
+        clock["now"] += 0.5
+        assert limiter.wait("a.gov") == 1.5
+        # A third caller arriving before the second finished sleeping queues
+        # behind the second's reserved slot
+        assert limiter.wait("a.gov") == 3.5
+
+    def test_domains_independent(self, monkeypatch):
+        clock = self._clock(monkeypatch)
+        limiter = RateLimiter(min_delay=2.0)
+        limiter.wait("a.gov")
+        assert limiter.wait("b.gov") == 0
+        assert clock["slept"] == []
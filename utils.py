@@ -43,22 +43,32 @@ def get_http_client(retries: int = 3, timeout: float = 20.0) -> httpx.Client:
 
 
 class RateLimiter:
-    """Enforce minimum delay between requests to the same domain."""
+    """Enforce minimum delay between requests to the same domain.
+
+    Each caller reserves the next free slot for its domain under the lock and
+    sleeps outside it, so threads waiting on one domain never hold up another
+    domain, and concurrent callers for the same domain are spaced min_delay
+    apart in arrival order.
+    """
 
     def __init__(self, min_delay: float = 1.0):
         self.min_delay = min_delay
-        self._last_request: dict[str, float] = {}
+        self._next_slot: dict[str, float] = {}
         self._lock = Lock()
 
-    def wait(self, domain: str) -> None:
-        """Sleep if needed to respect rate limit for domain."""
+    def wait(self, domain: str) -> float:
+        """Sleep if needed to respect rate limit for domain.
+
+        Returns the number of seconds slept.
+        """
         with self._lock:
-            now = time.time()
-            if domain in self._last_request:
-                elapsed = now - self._last_request[domain]
-                if elapsed < self.min_delay:
-                    time.sleep(self.min_delay - elapsed)
-            self._last_request[domain] = time.time()
+            now = time.monotonic()
+            start = max(now, self._next_slot.get(domain, now))
+            self._next_slot[domain] = start + self.min_delay
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
 
 
 # Pre-compiled patterns for normalize_title — comprehensive set covering all